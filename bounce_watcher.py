@@ -9,6 +9,10 @@ import sys
 import time
 import subprocess
 import logging
+import logging.handlers
+import heapq
+import threading
+import concurrent.futures
 from pathlib import Path
 from datetime import datetime
 from watchdog.observers import Observer
@@ -25,61 +29,127 @@ WATCH_ROOTS = [
 AUDIO_FILES_FOLDER = "Audio Files"
 MIX_FILE_PREFIX = "mix"  # case-insensitive match
 ICLOUD_DOWNLOADS = Path("/Users/payetteforward/Library/Mobile Documents/com~apple~CloudDocs/Downloads")
-STABILITY_CHECK_INTERVAL = 2  # seconds between stability checks
-STABILITY_CHECKS_REQUIRED = 3  # number of consecutive checks with same size
-CONVERTER_SCRIPT = Path(__file__).parent / "convert_mix.sh"
+_AUDIO_FILES_TOKEN = f"/{AUDIO_FILES_FOLDER}/"
+_MIX_PREFIX_LC = MIX_FILE_PREFIX.lower()
+_MIX_PREFIX_LEN = len(_MIX_PREFIX_LC)
+SCAN_ON_STARTUP = False  # log existing Audio Files folders at startup (slow on large drives)
+QUIESCE_SECONDS = 1.0  # seconds without write events before a file is considered stable
+CONVERTER_SCRIPT = (Path(__file__).parent / "convert_mix.sh").resolve()
+_CONVERTER_OK = CONVERTER_SCRIPT.exists()
+# Session subfolders that never contain an "Audio Files" folder - not descended into during scans
+SCAN_SKIP_FOLDERS = frozenset({
+    ".git",
+    "Bounces",
+    "Backups",
+    "Session File Backups",
+    "Cache Files",
+    "Fade Files",
+})
+
+LOG_FILE = Path.home() / ".local" / "share" / "bounce-watcher" / "bounce_watcher.log"
+
+
+class _BufferedFileHandler(logging.handlers.MemoryHandler):
+    """Buffer records for a file handler; written when full, on errors, and every FLUSH_INTERVAL seconds."""
+
+    FLUSH_INTERVAL = 5.0
+
+    def __init__(self, target, capacity=64):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self._stop_flushing = threading.Event()
+        threading.Thread(target=self._flush_periodically, name="log-flush", daemon=True).start()
+
+    def _flush_periodically(self):
+        # A quiet daemon would otherwise hold INFO lines until the buffer
+        # fills, and lose them if it is killed
+        while not self._stop_flushing.wait(self.FLUSH_INTERVAL):
+            self.flush()
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
 
 # Set up logging
+# Log outside the watched roots, rotate to bound disk use, and buffer records
+# so the file is written in batches (immediately on errors, at most
+# FLUSH_INTERVAL seconds late otherwise)
+LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+_rotating_handler = logging.handlers.RotatingFileHandler(LOG_FILE, maxBytes=5_000_000, backupCount=3)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(Path(__file__).parent / "bounce_watcher.log"),
+        _BufferedFileHandler(_rotating_handler),
         logging.StreamHandler(sys.stdout)
     ]
 )
+# basicConfig only formats the handlers it is given, so format the wrapped target too
+_rotating_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logger = logging.getLogger(__name__)
 
 # Track files being monitored for stability
 files_being_watched = {}
 
+# Heap of (quiesce_deadline, path) - the stability loop sleeps until the earliest one
+pending = []
+# Guards files_being_watched and pending, and wakes the stability loop
+cond = threading.Condition()
+
+# Conversions run here so a long afconvert never stalls stability checks
+conversion_pool = concurrent.futures.ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) // 2))
+
+# Files queued or converting, to avoid submitting the same bounce twice
+in_flight = set()
+in_flight_lock = threading.Lock()
+
+# Session output folders already created this run
+_created_session_dirs = set()
+_created_session_dirs_lock = threading.Lock()
+
 
 class FileStabilityMonitor:
     """Monitors a file until it stops being written to"""
 
     def __init__(self, file_path, callback):
         self.file_path = Path(file_path)
+        # Interned once - used as the watch key and for stat()
+        self.path_key = sys.intern(str(file_path))
         self.callback = callback
-        self.size_history = []
-        self.check_count = 0
+        self.last_write = time.monotonic()
+        self.last_size = None
 
-    def check_stability(self):
+    def record_write(self):
+        """Called for every write event on the file"""
+        self.last_write = time.monotonic()
+
+    def check_stability(self, now: float) -> bool:
         """Returns True if file is stable, False if still being written"""
+        # Still inside the write-coalesce window, no need to touch the disk
+        if now - self.last_write < QUIESCE_SECONDS:
+            return False
+
         try:
-            if not self.file_path.exists():
+            try:
+                current_size: int = os.stat(self.path_key).st_size
+            except FileNotFoundError:
                 logger.warning(f"File disappeared: {self.file_path}")
+                self.last_write = now
                 return False
 
-            current_size = self.file_path.stat().st_size
-
-            if len(self.size_history) == 0:
-                self.size_history.append(current_size)
-                return False
-
-            if current_size == self.size_history[-1]:
-                self.check_count += 1
-                if self.check_count >= STABILITY_CHECKS_REQUIRED:
-                    logger.info(f"File stable: {self.file_path} ({current_size} bytes)")
-                    return True
-            else:
-                # Size changed, reset counter
-                self.check_count = 0
-                self.size_history.append(current_size)
+            # Fallback for network mounts where FSEvents can miss writes:
+            # a size change since the last quiet check restarts the window
+            if current_size != self.last_size:
+                self.last_size = current_size
+                self.last_write = now
                 logger.debug(f"File still growing: {self.file_path} ({current_size} bytes)")
+                return False
 
-            return False
+            logger.info(f"File stable: {self.file_path} ({current_size} bytes)")
+            return True
         except Exception as e:
             logger.error(f"Error checking stability for {self.file_path}: {e}")
+            self.last_write = now
             return False
 
 
@@ -90,26 +160,57 @@ class MixFileHandler(FileSystemEventHandler):
         if event.is_directory:
             return
 
-        file_path = Path(event.src_path)
+        # Reject on the raw path string - most events are not mix files
+        src: str = event.src_path
 
-        # Check if this is in an "Audio Files" folder
-        if AUDIO_FILES_FOLDER not in file_path.parts:
+        # Check if this is directly in an "Audio Files" folder
+        idx = src.rfind(_AUDIO_FILES_TOKEN)
+        if idx < 0:
+            return
+        name: str = src[idx + len(_AUDIO_FILES_TOKEN):]
+        if "/" in name:
             return
 
         # Check if filename starts with "mix" (case-insensitive)
-        if not file_path.name.lower().startswith(MIX_FILE_PREFIX.lower()):
+        if name[:_MIX_PREFIX_LEN].lower() != _MIX_PREFIX_LC:
             return
 
+        file_path = Path(src)
         logger.info(f"New mix file detected: {file_path}")
 
         # Start monitoring this file for stability
-        if str(file_path) not in files_being_watched:
-            monitor = FileStabilityMonitor(file_path, self.process_stable_file)
-            files_being_watched[str(file_path)] = monitor
-            logger.info(f"Monitoring file for stability: {file_path}")
+        with cond:
+            if src not in files_being_watched:
+                monitor = FileStabilityMonitor(file_path, self.process_stable_file)
+                files_being_watched[monitor.path_key] = monitor
+                heapq.heappush(pending, (monitor.last_write + QUIESCE_SECONDS, monitor.path_key))
+                cond.notify()
+                logger.info(f"Monitoring file for stability: {file_path}")
+
+    def on_modified(self, event):
+        if event.is_directory:
+            return
+
+        # Only files already being monitored are of interest. The deadline
+        # only moves later, so the stability loop re-queues it lazily.
+        with cond:
+            monitor = files_being_watched.get(event.src_path)
+            if monitor:
+                monitor.record_write()
 
     def process_stable_file(self, file_path):
-        """Called when a file has stabilized and is ready for processing"""
+        """Called when a file has stabilized; queues it for conversion"""
+        file_path_str = str(file_path)
+        with in_flight_lock:
+            if file_path_str in in_flight:
+                logger.debug(f"Conversion already queued: {file_path}")
+                return
+            in_flight.add(file_path_str)
+
+        conversion_pool.submit(self._run_conversion, file_path)
+
+    def _run_conversion(self, file_path):
+        """Converts a stable file to M4A (runs on the conversion pool)"""
         logger.info(f"Processing stable file: {file_path}")
 
         try:
@@ -123,12 +224,10 @@ class MixFileHandler(FileSystemEventHandler):
 
             # Create subdirectory in iCloud Downloads if needed
             output_dir = ICLOUD_DOWNLOADS / session_name
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Call conversion script
-            if not CONVERTER_SCRIPT.exists():
-                logger.error(f"Converter script not found: {CONVERTER_SCRIPT}")
-                return
+            with _created_session_dirs_lock:
+                if session_name not in _created_session_dirs:
+                    output_dir.mkdir(parents=True, exist_ok=True)
+                    _created_session_dirs.add(session_name)
 
             logger.info(f"Converting {file_path.name} to M4A...")
             result = subprocess.run(
@@ -150,24 +249,52 @@ class MixFileHandler(FileSystemEventHandler):
             logger.error(f"Conversion timeout for {file_path}")
         except Exception as e:
             logger.error(f"Error processing {file_path}: {e}", exc_info=True)
+        finally:
+            with in_flight_lock:
+                in_flight.discard(str(file_path))
 
 
 def stability_check_loop():
-    """Periodically checks all monitored files for stability"""
+    """Sleeps until the next quiesce deadline and processes files that have stopped changing"""
     while True:
-        time.sleep(STABILITY_CHECK_INTERVAL)
+        with cond:
+            while not pending or pending[0][0] > time.monotonic():
+                cond.wait(timeout=pending[0][0] - time.monotonic() if pending else None)
+            _, file_path_str = heapq.heappop(pending)
+            monitor = files_being_watched.get(file_path_str)
+
+        if monitor is None:
+            continue
+
+        if monitor.check_stability(time.monotonic()):
+            with cond:
+                files_being_watched.pop(file_path_str, None)
+            # File is stable, process it
+            monitor.callback(monitor.file_path)
+        else:
+            # Written to since it was queued - wait out the new window
+            with cond:
+                heapq.heappush(pending, (monitor.last_write + QUIESCE_SECONDS, file_path_str))
 
-        # Check each file being monitored
-        files_to_remove = []
-        for file_path_str, monitor in list(files_being_watched.items()):
-            if monitor.check_stability():
-                # File is stable, process it
-                monitor.callback(monitor.file_path)
-                files_to_remove.append(file_path_str)
 
-        # Remove processed files from watch list
-        for file_path_str in files_to_remove:
-            del files_being_watched[file_path_str]
+def _scandir_recursive(path):
+    """Yield 'Audio Files' directory entries under path using cached dirent types"""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name == AUDIO_FILES_FOLDER:
+                    # Don't descend into Audio Files - it only holds audio
+                    yield entry
+                    continue
+                if entry.name in SCAN_SKIP_FOLDERS:
+                    continue
+                yield from _scandir_recursive(entry.path)
+    except PermissionError:
+        pass
 
 
 def find_audio_files_folders(root_path):
@@ -182,10 +309,10 @@ def find_audio_files_folders(root_path):
     logger.info(f"Scanning for Audio Files folders in: {root_path}")
 
     try:
-        for path in root.rglob(AUDIO_FILES_FOLDER):
-            if path.is_dir():
-                audio_folders.append(path)
-                logger.info(f"Found Audio Files folder: {path}")
+        for entry in _scandir_recursive(root):
+            path = Path(entry.path)
+            audio_folders.append(path)
+            logger.info(f"Found Audio Files folder: {path}")
     except PermissionError as e:
         logger.error(f"Permission denied scanning {root_path}: {e}")
     except Exception as e:
@@ -194,6 +321,26 @@ def find_audio_files_folders(root_path):
     return audio_folders
 
 
+def log_existing_audio_folders(roots):
+    """Log existing Audio Files folders - roots are independent, so scan them in parallel"""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(roots)) as executor:
+        for root, audio_folders in zip(roots, executor.map(find_audio_files_folders, roots)):
+            if audio_folders:
+                logger.info(f"Found {len(audio_folders)} existing Audio Files folders in {root}")
+
+
+def coalesce_watch_roots(root_paths):
+    """Drop duplicate roots and roots nested inside another root (already covered recursively)"""
+    kept = []
+    for root in sorted({Path(p).resolve() for p in root_paths}, key=lambda p: len(str(p))):
+        covering = next((k for k in kept if str(root).startswith(str(k).rstrip(os.sep) + os.sep)), None)
+        if covering:
+            logger.warning(f"Watch root {root} is inside {covering}, skipping duplicate watch")
+            continue
+        kept.append(root)
+    return kept
+
+
 def main():
     """Main entry point"""
     logger.info("=" * 80)
@@ -205,7 +352,7 @@ def main():
     logger.info(f"Converter script: {CONVERTER_SCRIPT}")
 
     # Verify converter script exists
-    if not CONVERTER_SCRIPT.exists():
+    if not _CONVERTER_OK:
         logger.error(f"Converter script not found at: {CONVERTER_SCRIPT}")
         logger.error("Please ensure convert_mix.sh is in the same directory as this script")
         sys.exit(1)
@@ -216,17 +363,14 @@ def main():
 
     # Watch each root directory
     watched_paths = []
-    for root_path in WATCH_ROOTS:
-        root = Path(root_path)
+    for root in coalesce_watch_roots(WATCH_ROOTS):
+        root_path = str(root)
         if root.exists():
             observer.schedule(event_handler, str(root), recursive=True)
             watched_paths.append(root)
             logger.info(f"Watching: {root}")
-
-            # Also log existing Audio Files folders
-            audio_folders = find_audio_files_folders(root)
-            if audio_folders:
-                logger.info(f"Found {len(audio_folders)} existing Audio Files folders")
+            if not SCAN_ON_STARTUP:
+                logger.info(f"Recursive watch active on {root}; startup enumeration skipped")
         else:
             logger.warning(f"Watch root does not exist: {root_path}")
 
@@ -238,8 +382,12 @@ def main():
     observer.start()
     logger.info("File system observer started")
 
+    # Optionally log existing Audio Files folders. The recursive watch already
+    # covers new ones, so scan in the background while events are collected.
+    if SCAN_ON_STARTUP:
+        threading.Thread(target=log_existing_audio_folders, args=(watched_paths,), daemon=True).start()
+
     # Start stability check loop in background
-    import threading
     stability_thread = threading.Thread(target=stability_check_loop, daemon=True)
     stability_thread.start()
     logger.info("Stability monitor started")
@@ -254,6 +402,7 @@ def main():
         observer.stop()
 
     observer.join()
+    conversion_pool.shutdown(wait=True)
     logger.info("Bounce watcher stopped")
 
 
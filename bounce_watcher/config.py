@@ -48,6 +48,8 @@ class Config:
             "folders": [],  # User must configure via wizard
             "audio_files_folder": "Audio Files",
             "mix_file_prefix": "mix",
+            "scan_on_startup": False,  # Log existing audio folders at startup (slow on large drives)
+            "use_polling": False,  # Poll for changes instead of native events (network drives)
         },
         "destination": {
             "mode": "icloud",  # or "nas" or "custom"
@@ -61,6 +63,7 @@ class Config:
             "sample_rate": 48000,
             "stability_check_interval": 2,
             "stability_checks_required": 3,
+            "parallel_jobs": 2,  # Conversions run at the same time
         },
         "logging": {
             "log_file": str(Path.home() / ".local" / "share" / "bounce-watcher" / "bounce_watcher.log"),
@@ -68,6 +71,21 @@ class Config:
         },
     }
 
+    # Validation schema, built once
+    REQUIRED_SECTIONS = ("source", "destination", "conversion", "logging")
+    SOURCE_MODES = frozenset({"specific_folders", "all_external_drives"})
+    DESTINATION_MODES = frozenset({"icloud", "nas", "custom"})
+    # Keys that must be non-empty for each mode
+    SOURCE_MODE_KEYS = {
+        "specific_folders": ("folders",),
+        "all_external_drives": (),
+    }
+    DESTINATION_MODE_KEYS = {
+        "icloud": ("icloud_path",),
+        "nas": ("nas_url", "nas_username", "nas_mount_point"),
+        "custom": ("custom_path",),
+    }
+
     def __init__(self, config_path: Optional[Path] = None):
         """
         Initialize configuration manager.
@@ -133,8 +151,10 @@ class Config:
         Returns:
             Default configuration dictionary
         """
-        import copy
-        return copy.deepcopy(self.DEFAULTS)
+        # One level deep is enough: "folders" is the only nested mutable value
+        defaults = {section: dict(values) for section, values in self.DEFAULTS.items()}
+        defaults["source"]["folders"] = list(self.DEFAULTS["source"]["folders"])
+        return defaults
 
     def _validate(self) -> None:
         """
@@ -144,8 +164,7 @@ class Config:
             ConfigError: If configuration is invalid
         """
         # Check required sections
-        required_sections = ["source", "destination", "conversion", "logging"]
-        for section in required_sections:
+        for section in self.REQUIRED_SECTIONS:
             if section not in self.config:
                 raise ConfigError(f"Missing required section: [{section}]")
 
@@ -153,26 +172,21 @@ class Config:
         source = self.config["source"]
         if "mode" not in source:
             raise ConfigError("Missing 'mode' in [source] section")
-        if source["mode"] not in ["specific_folders", "all_external_drives"]:
+        if source["mode"] not in self.SOURCE_MODES:
             raise ConfigError(f"Invalid source mode: {source['mode']}")
-        if source["mode"] == "specific_folders" and not source.get("folders"):
-            raise ConfigError("'folders' must be specified when source mode is 'specific_folders'")
+        for key in self.SOURCE_MODE_KEYS[source["mode"]]:
+            if not source.get(key):
+                raise ConfigError(f"'{key}' must be specified when source mode is '{source['mode']}'")
 
         # Validate destination section
         dest = self.config["destination"]
         if "mode" not in dest:
             raise ConfigError("Missing 'mode' in [destination] section")
-        if dest["mode"] not in ["icloud", "nas", "custom"]:
+        if dest["mode"] not in self.DESTINATION_MODES:
             raise ConfigError(f"Invalid destination mode: {dest['mode']}")
-        if dest["mode"] == "icloud" and not dest.get("icloud_path"):
-            raise ConfigError("'icloud_path' must be specified when destination mode is 'icloud'")
-        if dest["mode"] == "nas":
-            required_nas_keys = ["nas_url", "nas_username", "nas_mount_point"]
-            for key in required_nas_keys:
-                if not dest.get(key):
-                    raise ConfigError(f"'{key}' must be specified when destination mode is 'nas'")
-        if dest["mode"] == "custom" and not dest.get("custom_path"):
-            raise ConfigError("'custom_path' must be specified when destination mode is 'custom'")
+        for key in self.DESTINATION_MODE_KEYS[dest["mode"]]:
+            if not dest.get(key):
+                raise ConfigError(f"'{key}' must be specified when destination mode is '{dest['mode']}'")
 
         # Validate conversion section
         conv = self.config["conversion"]
@@ -180,6 +194,9 @@ class Config:
             raise ConfigError("Missing 'sample_rate' in [conversion] section")
         if not isinstance(conv["sample_rate"], int) or conv["sample_rate"] <= 0:
             raise ConfigError("'sample_rate' must be a positive integer")
+        jobs = conv.get("parallel_jobs", self.DEFAULTS["conversion"]["parallel_jobs"])
+        if not isinstance(jobs, int) or jobs <= 0:
+            raise ConfigError("'parallel_jobs' must be a positive integer")
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -4,35 +4,238 @@ Interactive configuration utility for Bounce Watcher.
 Provides a CLI wizard for setting up Bounce Watcher configuration.
 """
 
+import os
 import sys
-import subprocess
-import getpass
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from os.path import lexists
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from .config import Config, ConfigError
-from .sources import SourceManager
-from .destinations import (
-    DestinationManager,
-    set_keychain_password,
-    get_keychain_password,
-    KeychainError
+
+# SourceManager, DestinationManager, keychain helpers, launchd, getpass and
+# subprocess are imported inside the functions that use them so --help/--status start fast
+
+# Default paths offered by the wizard, computed once
+_HOME = Path.home()
+_DEFAULT_ICLOUD = str(_HOME / "Library" / "Mobile Documents" / "com~apple~CloudDocs" / "Downloads")
+_DEFAULT_CUSTOM = str(_HOME / "Music" / "Bounce Watcher")
+_DEFAULT_LOG = str(_HOME / "scripts" / "bounce-watcher" / "bounce_watcher.log")
+_DEFAULT_NAS_URL = "smb://your-nas-server.local/share"
+_DEFAULT_NAS_USERNAME = "your-username"
+_DEFAULT_NAS_MOUNT = "/Volumes/NAS"
+
+# Background external drive detection for this wizard session
+_drive_detection: Optional[Future] = None
+_drive_probe_cache: Optional[Tuple[list, list]] = None
+_drives_shown = False
+
+# Seconds to wait for the optional NAS connection test
+_NAS_TEST_TIMEOUT = 10
+
+# Conversion settings prompted for: (config key, prompt, default, minimum, allow going back)
+_CONVERSION_SETTINGS = (
+    ("sample_rate", "Target sample rate (Hz)", 48000, 1, True),
+    ("stability_check_interval", "Stability check interval (seconds)", 2, 1, False),
+    ("stability_checks_required", "Number of stability checks required", 3, 1, False),
+    ("parallel_jobs", "Number of files to convert at the same time",
+     Config.DEFAULTS["conversion"]["parallel_jobs"], 1, False),
 )
-from .launchd import get_launch_agent_manager, LaunchdError
+
+# Mode values in the order the wizard menus list them
+_SOURCE_MODES = ("specific_folders", "all_external_drives")
+_DESTINATION_MODES = ("icloud", "nas", "custom")
+
+# Accepted answers for yes/no prompts
+_YES = frozenset({"y", "yes", "yeah", "yep", "true", "1"})
+_NO = frozenset({"n", "no", "nope", "false", "0"})
+
+# Log levels offered by the logging step, in menu order
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING")
+
+# Path existence answers for this wizard run
+_exists_cache: Dict[str, bool] = {}
+
+# Banner rules for headers and sections
+_HEADER_RULE = "=" * 80
+_SECTION_RULE = "-" * 80
+
+# LaunchAgent manager shared by the wizard steps (see _get_launch_agent_manager)
+_launch_agent_manager = None
+
+# Whether a keychain password exists, per (account, server), for this wizard run
+_keychain_has_password: Dict[Tuple[str, str], bool] = {}
 
 
 def print_header(text: str):
     """Print a formatted header."""
-    print("\n" + "=" * 80)
-    print(text.center(80))
-    print("=" * 80 + "\n")
+    print(f"\n{_HEADER_RULE}\n{text.center(80)}\n{_HEADER_RULE}\n", flush=True)
 
 
 def print_section(text: str):
     """Print a formatted section header."""
-    print("\n" + "-" * 80)
-    print(text)
-    print("-" * 80 + "\n")
+    print(f"\n{_SECTION_RULE}\n{text}\n{_SECTION_RULE}\n", flush=True)
+
+
+def _path_exists(path: str) -> bool:
+    """
+    Check whether a path exists, remembering the answer for the wizard run.
+
+    Avoids repeating the same stat on slow network home directories when
+    the user goes back and re-enters a path. Paths the wizard creates are
+    recorded in _exists_cache directly.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if path exists
+    """
+    exists = _exists_cache.get(path)
+    if exists is None:
+        exists = _exists_cache[path] = lexists(path)
+    return exists
+
+
+def _has_keychain_password(account: str, server: str) -> bool:
+    """
+    Check whether a NAS password is stored in the keychain.
+
+    Each lookup forks the security tool, so the answer is remembered for
+    the wizard run (only the yes/no, never the password itself).
+
+    Args:
+        account: Account/username
+        server: Server name
+
+    Returns:
+        True if a password is stored
+    """
+    key = (account, server)
+    if key not in _keychain_has_password:
+        from .destinations import get_keychain_password, KeychainError
+
+        try:
+            _keychain_has_password[key] = bool(get_keychain_password(account, server))
+        except KeychainError:
+            _keychain_has_password[key] = False
+    return _keychain_has_password[key]
+
+
+def _start_drive_detection(rescan: bool = False) -> Future:
+    """
+    Start detecting external drives in the background, once per wizard session.
+
+    Detection runs diskutil for every volume, so it is started early and
+    overlaps with the user answering prompts. Going back to the source step
+    reuses the result unless a rescan is requested.
+
+    Args:
+        rescan: Discard any previous result and detect again
+
+    Returns:
+        Future resolving to the list of detected DriveInfo objects
+    """
+    global _drive_detection, _drive_probe_cache
+
+    if _drive_detection is None or rescan:
+        from .sources import SourceManager
+
+        _drive_probe_cache = None
+        future = Future()
+        source_mgr = SourceManager({"mode": "all_external_drives"})
+
+        def detect():
+            try:
+                future.set_result(source_mgr._detect_external_drives())
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=detect, daemon=True).start()
+        _drive_detection = future
+
+    return _drive_detection
+
+
+def _start_nas_test(dest_config: dict) -> Future:
+    """
+    Test a NAS destination on a background thread.
+
+    Mounting can hang on an unreachable server, so the wizard waits on the
+    returned future with a timeout. A daemon thread is used, as for drive
+    detection, so a stuck mount can't keep the wizard from exiting.
+
+    Args:
+        dest_config: Destination configuration to test
+
+    Returns:
+        Future resolving to the result of test_destination()
+    """
+    from .destinations import DestinationManager
+
+    future = Future()
+
+    def probe():
+        try:
+            future.set_result(DestinationManager(dest_config).test_destination())
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=probe, daemon=True).start()
+    return future
+
+
+def _probe_drives() -> Tuple[list, list]:
+    """
+    Return the detected and the suitable external drives.
+
+    Waits for the background detection and filters its result once per
+    detection; filtering prints its exclusions, so it runs on this thread.
+
+    Returns:
+        Tuple of (detected drives, drives left after smart filtering)
+    """
+    global _drive_probe_cache
+
+    if _drive_probe_cache is None:
+        from .sources import SourceManager
+
+        detected = _start_drive_detection().result()
+        filtered = SourceManager({"mode": "all_external_drives"})._apply_smart_filtering(detected)
+        _drive_probe_cache = (detected, filtered)
+
+    return _drive_probe_cache
+
+
+def _menu_default(options: tuple, value, fallback: int = 0) -> int:
+    """Return the menu index of value, or fallback if it isn't one of the options."""
+    return options.index(value) if value in options else fallback
+
+
+def _get_launch_agent_manager():
+    """
+    Return the LaunchAgent manager for this run, creating it on first use.
+
+    Creating one runs `which bounce-watcher`, so it is done at most once.
+    """
+    global _launch_agent_manager
+    if _launch_agent_manager is None:
+        from .launchd import get_launch_agent_manager
+        _launch_agent_manager = get_launch_agent_manager()
+    return _launch_agent_manager
+
+
+def _disable_input_history():
+    """
+    Keep wizard answers out of readline history.
+
+    Only matters when readline is already loaded (e.g. when run from an
+    interactive session); a plain console script never imports it.
+    """
+    readline = sys.modules.get("readline")
+    if readline is not None and hasattr(readline, "set_auto_history"):
+        readline.set_auto_history(False)
 
 
 class GoBackException(Exception):
@@ -70,6 +273,38 @@ def get_input(prompt: str, default: Optional[str] = None, allow_back: bool = Fal
     return value if value else default
 
 
+def get_int(prompt: str, default: int, min_value: Optional[int] = None, allow_back: bool = False) -> int:
+    """
+    Get integer input from user, asking again until the answer is valid.
+
+    Args:
+        prompt: Prompt text
+        default: Default value if user presses Enter
+        min_value: Smallest accepted value, if any
+        allow_back: If True, allow user to type 'b' or 'back' to raise GoBackException
+
+    Returns:
+        Parsed integer or default value
+
+    Raises:
+        GoBackException: If user types 'b' or 'back' and allow_back is True
+    """
+    while True:
+        value = get_input(prompt, default=str(default), allow_back=allow_back)
+
+        try:
+            number = int(value)
+        except ValueError:
+            print("Please enter a whole number.")
+            continue
+
+        if min_value is not None and number < min_value:
+            print(f"Please enter a number of at least {min_value}.")
+            continue
+
+        return number
+
+
 def get_yes_no(prompt: str, default: bool = True) -> bool:
     """
     Get yes/no input from user.
@@ -79,15 +314,16 @@ def get_yes_no(prompt: str, default: bool = True) -> bool:
         default: Default value if user presses Enter
 
     Returns:
-        True for yes, False for no
+        True for yes, False for no (default for empty or unrecognized input)
     """
     default_str = "Y/n" if default else "y/N"
     value = input(f"{prompt} [{default_str}]: ").strip().lower()
 
-    if not value:
-        return default
-
-    return value in ["y", "yes"]
+    if value in _YES:
+        return True
+    if value in _NO:
+        return False
+    return default
 
 
 def get_choice(prompt: str, choices: list, default: int = 0, allow_back: bool = False) -> int:
@@ -109,39 +345,52 @@ def get_choice(prompt: str, choices: list, default: int = 0, allow_back: bool =
         print(f"  {marker} {i + 1}. {choice}")
 
     back_hint = " (or 'b' to go back)" if allow_back else ""
+    prompt_line = f"\nEnter choice [1-{len(choices)}]{back_hint} (default: {default + 1}): "
+    # Map the expected answers straight to their index
+    valid = {str(i + 1): i for i in range(len(choices))}
+
     while True:
-        value = input(f"\nEnter choice [1-{len(choices)}]{back_hint} (default: {default + 1}): ").strip().lower()
+        value = input(prompt_line).strip().lower()
 
         if not value:
             return default
 
+        if value in valid:
+            return valid[value]
+
         # Check for go back command
         if allow_back and value in ['b', 'back']:
             return -1
 
-        try:
+        # Unusual digits (e.g. leading zeros) - parse them
+        if value.isdigit():
             choice_num = int(value)
             if 1 <= choice_num <= len(choices):
                 return choice_num - 1
-            else:
-                print(f"Please enter a number between 1 and {len(choices)}")
-        except ValueError:
+            print(f"Please enter a number between 1 and {len(choices)}")
+        else:
             if allow_back:
                 print("Please enter a valid number or 'b' to go back")
             else:
                 print("Please enter a valid number")
 
 
-def configure_source() -> dict:
+def configure_source(existing: Optional[dict] = None) -> dict:
     """
     Configure source settings interactively.
 
+    Args:
+        existing: Current source settings, offered as defaults
+
     Returns:
         Source configuration dictionary
 
     Raises:
         GoBackException: If user wants to go back
     """
+    global _drives_shown
+    current = existing or {}
+
     print_section("SOURCE CONFIGURATION")
 
     # Choose mode
@@ -151,7 +400,7 @@ def configure_source() -> dict:
             "Specific folders (manually choose which drives/folders to watch)",
             "All external drives (automatically detect and watch all external drives)"
         ],
-        default=0,
+        default=_menu_default(_SOURCE_MODES, current.get("mode")),
         allow_back=True
     )
 
@@ -163,24 +412,31 @@ def configure_source() -> dict:
         # Specific folders mode
         mode = "specific_folders"
         folders = []
+        current_folders = current.get("folders") or []
 
         print("\nEnter folder paths to watch (one per line).")
         print("Press Enter on an empty line when done.")
         print("\nExamples:")
         print("  /Volumes/Great 8")
         print("  /Volumes/Crazy 8")
+        if current_folders:
+            print("\nCurrently watching (press Enter now to keep these):")
+            for folder in current_folders:
+                print(f"  {folder}")
         print()
 
         while True:
             folder = input(f"Folder {len(folders) + 1} (or Enter to finish): ").strip()
             if not folder:
                 if len(folders) == 0:
+                    if current_folders:
+                        folders = list(current_folders)
+                        break
                     print("You must specify at least one folder.")
                     continue
                 break
 
-            folder_path = Path(folder)
-            if not folder_path.exists():
+            if not _path_exists(folder):
                 if get_yes_no(f"Warning: '{folder}' does not exist. Add anyway?", default=False):
                     folders.append(folder)
             else:
@@ -191,37 +447,47 @@ def configure_source() -> dict:
         mode = "all_external_drives"
         folders = []
 
-        # Show currently detected drives
+        # Detection keeps running while the remaining questions are asked
+        if _drives_shown and get_yes_no("\nRescan external drives?", default=False):
+            _start_drive_detection(rescan=True)
+        else:
+            _start_drive_detection()
         print("\nDetecting external drives...")
-        try:
-            source_mgr = SourceManager({"mode": mode})
-            detected = source_mgr._detect_external_drives()
-            filtered = source_mgr._apply_smart_filtering(detected)
-
-            if filtered:
-                print(f"\nFound {len(filtered)} suitable external drive(s):")
-                for drive in filtered:
-                    size_gb = drive.size_bytes / (1024 ** 3)
-                    print(f"  - {drive.mount_point} ({drive.volume_name}, {size_gb:.1f} GB, {drive.filesystem})")
-            else:
-                print("\nNo suitable external drives found.")
-                print("The watcher will start monitoring when drives are connected.")
-        except Exception as e:
-            print(f"\nWarning: Could not detect drives: {e}")
 
     # Audio folder name
     audio_folder = get_input(
         "\nName of the audio files folder within Pro Tools sessions",
-        default="Audio Files"
+        default=current.get("audio_files_folder") or "Audio Files"
     )
 
     # Mix file prefix
     mix_prefix = get_input(
         "Prefix for mix files to detect (case-insensitive)",
-        default="mix"
+        default=current.get("mix_file_prefix") or "mix"
     )
 
+    if mode == "all_external_drives":
+        # Show currently detected drives
+        try:
+            _, filtered = _probe_drives()
+            _drives_shown = True
+
+            if filtered:
+                lines = [
+                    f"  - {d.mount_point} ({d.volume_name}, {d.size_bytes / (1 << 30):.1f} GB, {d.filesystem})"
+                    for d in filtered
+                ]
+                sys.stdout.write(f"\nFound {len(filtered)} suitable external drive(s):\n" + "\n".join(lines) + "\n")
+                sys.stdout.flush()
+            else:
+                print("\nNo suitable external drives found.")
+                print("The watcher will start monitoring when drives are connected.")
+        except Exception as e:
+            print(f"\nWarning: Could not detect drives: {e}")
+
+    # Keep settings the wizard doesn't ask about (e.g. scan_on_startup)
     return {
+        **current,
         "mode": mode,
         "folders": folders,
         "audio_files_folder": audio_folder,
@@ -229,16 +495,32 @@ def configure_source() -> dict:
     }
 
 
-def configure_destination() -> dict:
+def configure_destination(existing: Optional[dict] = None) -> dict:
     """
     Configure destination settings interactively.
 
+    Args:
+        existing: Current destination settings, offered as defaults
+
     Returns:
         Destination configuration dictionary
 
     Raises:
         GoBackException: If user wants to go back
     """
+    import getpass
+    from .destinations import set_keychain_password, KeychainError
+
+    current = existing or {}
+    # Paths for every mode are saved, so unchosen modes keep their current values
+    settings = {
+        "icloud_path": current.get("icloud_path") or _DEFAULT_ICLOUD,
+        "nas_url": current.get("nas_url") or _DEFAULT_NAS_URL,
+        "nas_username": current.get("nas_username") or _DEFAULT_NAS_USERNAME,
+        "nas_mount_point": current.get("nas_mount_point") or _DEFAULT_NAS_MOUNT,
+        "custom_path": current.get("custom_path") or _DEFAULT_CUSTOM,
+    }
+
     print_section("DESTINATION CONFIGURATION")
 
     # Choose mode
@@ -249,7 +531,7 @@ def configure_destination() -> dict:
             "Network storage (NAS via SMB)",
             "Custom folder"
         ],
-        default=0,
+        default=_menu_default(_DESTINATION_MODES, current.get("mode")),
         allow_back=True
     )
 
@@ -260,25 +542,17 @@ def configure_destination() -> dict:
     if mode_choice == 0:
         # iCloud mode
         mode = "icloud"
-        default_icloud = str(Path.home() / "Library" / "Mobile Documents" / "com~apple~CloudDocs" / "Downloads")
         icloud_path = get_input(
             "\nPath to iCloud Downloads folder",
-            default=default_icloud
+            default=settings["icloud_path"]
         )
 
         # Verify path exists
-        if not Path(icloud_path).exists():
+        if not _path_exists(icloud_path):
             print(f"Warning: Path does not exist: {icloud_path}")
             print("Make sure iCloud Drive is enabled and syncing.")
 
-        return {
-            "mode": mode,
-            "icloud_path": icloud_path,
-            "nas_url": "smb://your-nas-server.local/share",
-            "nas_username": "your-username",
-            "nas_mount_point": "/Volumes/NAS",
-            "custom_path": str(Path.home() / "Music" / "Bounce Watcher"),
-        }
+        return {**settings, "mode": mode, "icloud_path": icloud_path}
 
     elif mode_choice == 1:
         # NAS mode
@@ -286,83 +560,86 @@ def configure_destination() -> dict:
 
         nas_url = get_input(
             "\nNAS URL (SMB)",
-            default="smb://your-nas-server.local/share"
+            default=settings["nas_url"]
         )
 
         nas_username = get_input(
             "NAS username",
-            default="your-username"
+            default=settings["nas_username"]
         )
 
         nas_mount_point = get_input(
             "Local mount point for NAS",
-            default="/Volumes/NAS"
+            default=settings["nas_mount_point"]
         )
 
         # Prompt for password and store in keychain
         print("\nNAS password will be stored securely in macOS Keychain.")
 
         # Check if password already exists
-        server = nas_url.replace("smb://", "").split("/")[0]
-        try:
-            existing_password = get_keychain_password(nas_username, server)
-            if existing_password:
-                if get_yes_no(f"Password already exists in keychain for {nas_username}@{server}. Update?", default=False):
-                    password = getpass.getpass("Enter NAS password: ")
-                    if password:
-                        set_keychain_password(nas_username, server, password)
-                        print("Password updated in keychain.")
-        except KeychainError:
-            # No existing password
+        server = nas_url.removeprefix("smb://").partition("/")[0]
+        existing_password = _has_keychain_password(nas_username, server)
+
+        if existing_password:
+            update = get_yes_no(f"Password already exists in keychain for {nas_username}@{server}. Update?", default=False)
+        else:
+            update = True
+
+        if update:
+            # set_keychain_password updates in place, so no second lookup is needed
             password = getpass.getpass("Enter NAS password: ")
             if password:
-                set_keychain_password(nas_username, server, password)
-                print("Password stored in keychain.")
-            else:
+                try:
+                    set_keychain_password(nas_username, server, password)
+                    _keychain_has_password[(nas_username, server)] = True
+                    print("Password updated in keychain." if existing_password else "Password stored in keychain.")
+                except KeychainError as e:
+                    print(f"Warning: Could not store password in keychain: {e}")
+            elif not existing_password:
                 print("Warning: No password provided. You'll need to add it to keychain manually.")
 
         # Test NAS connection
         if get_yes_no("\nTest NAS connection now?", default=True):
             print("Testing NAS connection...")
+            nas_test = _start_nas_test({
+                "mode": mode,
+                "nas_url": nas_url,
+                "nas_username": nas_username,
+                "nas_mount_point": nas_mount_point,
+            })
             try:
-                dest_mgr = DestinationManager({
-                    "mode": mode,
-                    "nas_url": nas_url,
-                    "nas_username": nas_username,
-                    "nas_mount_point": nas_mount_point,
-                })
-                if dest_mgr.test_destination():
+                if nas_test.result(timeout=_NAS_TEST_TIMEOUT):
                     print("✓ NAS connection successful!")
                 else:
                     print("✗ NAS connection failed. Please check your settings.")
+            except FutureTimeoutError:
+                print(f"✗ NAS did not respond within {_NAS_TEST_TIMEOUT} seconds. Please check your settings.")
             except Exception as e:
                 print(f"✗ NAS connection failed: {e}")
 
         return {
+            **settings,
             "mode": mode,
-            "icloud_path": str(Path.home() / "Library" / "Mobile Documents" / "com~apple~CloudDocs" / "Downloads"),
             "nas_url": nas_url,
             "nas_username": nas_username,
             "nas_mount_point": nas_mount_point,
-            "custom_path": str(Path.home() / "Music" / "Bounce Watcher"),
         }
 
     else:
         # Custom folder mode
         mode = "custom"
 
-        default_custom = str(Path.home() / "Music" / "Bounce Watcher")
         custom_path = get_input(
             "\nCustom folder path (where converted files will be saved)",
-            default=default_custom
+            default=settings["custom_path"]
         )
 
         # Verify/create path
-        custom_path_obj = Path(custom_path)
-        if not custom_path_obj.exists():
+        if not _path_exists(custom_path):
             if get_yes_no(f"\nFolder does not exist. Create it?", default=True):
                 try:
-                    custom_path_obj.mkdir(parents=True, exist_ok=True)
+                    Path(custom_path).mkdir(parents=True, exist_ok=True)
+                    _exists_cache[custom_path] = True
                     print(f"✓ Created folder: {custom_path}")
                 except Exception as e:
                     print(f"✗ Failed to create folder: {e}")
@@ -371,90 +648,59 @@ def configure_destination() -> dict:
         else:
             print(f"✓ Folder exists: {custom_path}")
 
-        return {
-            "mode": mode,
-            "icloud_path": str(Path.home() / "Library" / "Mobile Documents" / "com~apple~CloudDocs" / "Downloads"),
-            "nas_url": "smb://your-nas-server.local/share",
-            "nas_username": "your-username",
-            "nas_mount_point": "/Volumes/NAS",
-            "custom_path": custom_path,
-        }
+        return {**settings, "mode": mode, "custom_path": custom_path}
 
 
-def configure_conversion() -> dict:
+def configure_conversion(existing: Optional[dict] = None) -> dict:
     """
     Configure conversion settings interactively.
 
+    Args:
+        existing: Current conversion settings, offered as defaults
+
     Returns:
         Conversion configuration dictionary
 
     Raises:
         GoBackException: If user wants to go back
     """
-    print_section("CONVERSION SETTINGS")
-
-    sample_rate = get_input(
-        "Target sample rate (Hz)",
-        default="48000",
-        allow_back=True
-    )
-
-    try:
-        sample_rate = int(sample_rate)
-    except ValueError:
-        print("Invalid sample rate, using default 48000")
-        sample_rate = 48000
-
-    stability_interval = get_input(
-        "Stability check interval (seconds)",
-        default="2"
-    )
-
-    try:
-        stability_interval = int(stability_interval)
-    except ValueError:
-        stability_interval = 2
-
-    stability_checks = get_input(
-        "Number of stability checks required",
-        default="3"
-    )
+    current = existing or {}
 
-    try:
-        stability_checks = int(stability_checks)
-    except ValueError:
-        stability_checks = 3
+    print_section("CONVERSION SETTINGS")
 
     return {
-        "sample_rate": sample_rate,
-        "stability_check_interval": stability_interval,
-        "stability_checks_required": stability_checks,
+        key: get_int(prompt, default=current.get(key, default), min_value=min_value, allow_back=allow_back)
+        for key, prompt, default, min_value, allow_back in _CONVERSION_SETTINGS
     }
 
 
-def configure_logging() -> dict:
+def configure_logging(existing: Optional[dict] = None) -> dict:
     """
     Configure logging settings interactively.
 
+    Args:
+        existing: Current logging settings, offered as defaults
+
     Returns:
         Logging configuration dictionary
 
     Raises:
         GoBackException: If user wants to go back
     """
+    current = existing or {}
+
     print_section("LOGGING SETTINGS")
 
-    default_log = str(Path.home() / "scripts" / "bounce-watcher" / "bounce_watcher.log")
     log_file = get_input(
         "Log file path",
-        default=default_log,
+        default=current.get("log_file") or _DEFAULT_LOG,
         allow_back=True
     )
 
     log_level = get_choice(
         "Log level",
         ["DEBUG (verbose)", "INFO (normal)", "WARNING (errors only)"],
-        default=1,
+        default=_menu_default(_LOG_LEVELS, str(current.get("level", "")).upper(), fallback=1),
         allow_back=True
     )
 
@@ -462,11 +708,9 @@ def configure_logging() -> dict:
     if log_level == -1:
         raise GoBackException()
 
-    level_map = {0: "DEBUG", 1: "INFO", 2: "WARNING"}
-
     return {
         "log_file": log_file,
-        "level": level_map[log_level],
+        "level": _LOG_LEVELS[log_level],
     }
 
 
@@ -477,9 +721,11 @@ def configure_launchagent(config_path: Path):
     Args:
         config_path: Path to configuration file
     """
+    from .launchd import LaunchdError
+
     print_section("LAUNCHAGENT SETUP")
 
-    launch_mgr = get_launch_agent_manager()
+    launch_mgr = _get_launch_agent_manager()
 
     # Check current status
     status = launch_mgr.get_status()
@@ -501,20 +747,23 @@ def configure_launchagent(config_path: Path):
     if not get_yes_no("\nInstall/update LaunchAgent?", default=True):
         return
 
-    # Determine paths
-    working_dir = config_path.parent
-    log_stdout = working_dir / "stdout.log"
-    log_stderr = working_dir / "stderr.log"
+    # Determine paths (both logs live in the working directory)
+    working_dir = os.fspath(config_path.parent)
+    log_stdout = os.path.join(working_dir, "stdout.log")
+    log_stderr = os.path.join(working_dir, "stderr.log")
 
     try:
+        # launchd won't create the log directory itself
+        os.makedirs(working_dir, exist_ok=True)
+
         # Ensure single instance
         launch_mgr.ensure_single_instance()
 
         # Install
         launch_mgr.install(
-            working_directory=working_dir,
-            log_stdout=log_stdout,
-            log_stderr=log_stderr,
+            working_directory=Path(working_dir),
+            log_stdout=Path(log_stdout),
+            log_stderr=Path(log_stderr),
             load=True
         )
 
@@ -523,30 +772,30 @@ def configure_launchagent(config_path: Path):
         print(f"  stdout: {log_stdout}")
         print(f"  stderr: {log_stderr}")
 
-    except LaunchdError as e:
+    except (LaunchdError, OSError) as e:
         print(f"\n✗ Failed to install LaunchAgent: {e}")
 
 
-def select_sections_to_configure() -> list:
+def select_sections_to_configure() -> Tuple[list, Optional[Config]]:
     """
     Let user select which sections to configure.
 
     Returns:
-        List of section keys to configure
+        Tuple of (section keys to configure, loaded existing config or None)
     """
     config = Config()
     existing_config = config.exists()
 
     if not existing_config:
         # No existing config, must configure everything
-        return ["source", "destination", "conversion", "logging"]
+        return ["source", "destination", "conversion", "logging"], None
 
     # Load existing config to show current values
     try:
         config.load()
     except ConfigError:
         # Config exists but is invalid, reconfigure everything
-        return ["source", "destination", "conversion", "logging"]
+        return ["source", "destination", "conversion", "logging"], None
 
     print_section("SELECTIVE CONFIGURATION")
     print("You have an existing configuration. You can:")
@@ -565,7 +814,7 @@ def select_sections_to_configure() -> list:
 
     if choice == 0:
         # Reconfigure everything
-        return ["source", "destination", "conversion", "logging"]
+        return ["source", "destination", "conversion", "logging"], config
 
     # Let user select sections
     print("\nSelect which sections you want to reconfigure:")
@@ -606,11 +855,12 @@ def select_sections_to_configure() -> list:
         print("\nNo sections selected. Configuration unchanged.")
         sys.exit(0)
 
-    return sections
+    return sections, config
 
 
 def run_interactive_wizard():
     """Run the full interactive configuration wizard with go-back support."""
+    _disable_input_history()
     print_header("BOUNCE WATCHER CONFIGURATION WIZARD")
 
     print("This wizard will help you set up Bounce Watcher.")
@@ -622,18 +872,15 @@ def run_interactive_wizard():
         sys.exit(0)
 
     # Determine which sections to configure
-    sections_to_configure = select_sections_to_configure()
+    sections, existing = select_sections_to_configure()
+    selected = frozenset(sections)
 
-    # Load existing configuration to preserve unmodified sections
-    config = Config()
-    if config.exists():
-        try:
-            config.load()
-            config_dict = config.config.copy()
-        except ConfigError:
-            config_dict = {}
-    else:
-        config_dict = {}
+    # Detect drives while the user works through the first prompts
+    if "source" in selected:
+        _start_drive_detection()
+
+    # Existing configuration (already loaded above) preserves unmodified sections
+    config_dict = existing.config.copy() if existing else {}
 
     # Configuration steps as a state machine
     all_steps = [
@@ -644,7 +891,7 @@ def run_interactive_wizard():
     ]
 
     # Filter to only steps that need configuration
-    steps = [step for step in all_steps if step[0] in sections_to_configure]
+    steps = [step for step in all_steps if step[0] in selected]
 
     if not steps:
         print("\nNo configuration changes needed.")
@@ -657,8 +904,8 @@ def run_interactive_wizard():
         step_key, step_title, step_func = steps[current_step]
 
         try:
-            # Run configuration step
-            config_dict[step_key] = step_func()
+            # Run configuration step, offering current values as defaults
+            config_dict[step_key] = step_func(config_dict.get(step_key))
             # Move to next step on success
             current_step += 1
 
@@ -675,8 +922,13 @@ def run_interactive_wizard():
 
     # Show summary of what was configured
     all_section_keys = ["source", "destination", "conversion", "logging"]
-    modified_sections = [key for key in all_section_keys if key in sections_to_configure]
-    preserved_sections = [key for key in all_section_keys if key not in sections_to_configure and key in config_dict]
+    modified_sections = []
+    preserved_sections = []
+    for key in all_section_keys:
+        if key in selected:
+            modified_sections.append(key)
+        elif key in config_dict:
+            preserved_sections.append(key)
 
     if modified_sections:
         print("Modified sections:")
@@ -699,8 +951,8 @@ def run_interactive_wizard():
         sys.exit(1)
 
     # Configure LaunchAgent (only if first time or source/destination changed)
-    needs_service_restart = any(key in sections_to_configure for key in ["source", "destination"])
-    if needs_service_restart or not get_launch_agent_manager().is_installed():
+    needs_service_restart = not selected.isdisjoint(("source", "destination"))
+    if needs_service_restart or not _get_launch_agent_manager().is_installed():
         configure_launchagent(config.config_path)
     else:
         print("\nService configuration unchanged. Restart service to apply changes:")
@@ -742,7 +994,7 @@ def show_status():
 
     # Check LaunchAgent
     print()
-    launch_mgr = get_launch_agent_manager()
+    launch_mgr = _get_launch_agent_manager()
     launch_mgr.print_status()
 
 
@@ -789,6 +1041,9 @@ def test_configuration():
 
 def uninstall_bounce_watcher():
     """Completely uninstall Bounce Watcher service and configuration."""
+    import subprocess
+    from .launchd import LaunchdError
+
     print_header("BOUNCE WATCHER UNINSTALL")
 
     print("This will completely remove Bounce Watcher from your system:")
@@ -807,11 +1062,9 @@ def uninstall_bounce_watcher():
     errors = []
 
     # 1. Stop and remove LaunchAgent
-    print("\n" + "-" * 80)
-    print("Removing LaunchAgent service...")
-    print("-" * 80)
+    print(f"\n{_SECTION_RULE}\nRemoving LaunchAgent service...\n{_SECTION_RULE}")
     try:
-        launch_mgr = get_launch_agent_manager()
+        launch_mgr = _get_launch_agent_manager()
         if launch_mgr.is_installed():
             launch_mgr.uninstall()
             removed_items.append(f"LaunchAgent: {launch_mgr.plist_path}")
@@ -822,9 +1075,7 @@ def uninstall_bounce_watcher():
         print(f"✗ {errors[-1]}")
 
     # 2. Remove configuration file
-    print("\n" + "-" * 80)
-    print("Removing configuration...")
-    print("-" * 80)
+    print(f"\n{_SECTION_RULE}\nRemoving configuration...\n{_SECTION_RULE}")
     config = Config()
     if config.exists():
         try:
@@ -838,21 +1089,23 @@ def uninstall_bounce_watcher():
         print("No configuration file found (already removed)")
 
     # 3. Remove log files
-    print("\n" + "-" * 80)
-    print("Removing log files...")
-    print("-" * 80)
+    print(f"\n{_SECTION_RULE}\nRemoving log files...\n{_SECTION_RULE}")
     config_dir = config.config_path.parent
     if config_dir.exists():
         log_files = list(config_dir.glob("*.log"))
         if log_files:
             for log_file in log_files:
+                log_path = str(log_file)
                 try:
-                    log_file.unlink()
-                    removed_items.append(f"Log: {log_file}")
-                    print(f"✓ Removed: {log_file}")
-                except Exception as e:
-                    errors.append(f"Failed to remove {log_file}: {e}")
+                    os.unlink(log_path)
+                except FileNotFoundError:
+                    continue  # Removed since the glob, nothing left to do
+                except OSError as e:
+                    errors.append(f"Failed to remove {log_path}: {e}")
                     print(f"✗ {errors[-1]}")
+                    continue
+                removed_items.append(f"Log: {log_path}")
+                print(f"✓ Removed: {log_path}")
         else:
             print("No log files found")
 
@@ -868,14 +1121,12 @@ def uninstall_bounce_watcher():
         print("Configuration directory not found")
 
     # 4. Check for old LaunchAgents (cleanup from previous versions)
-    print("\n" + "-" * 80)
-    print("Checking for old LaunchAgents...")
-    print("-" * 80)
+    print(f"\n{_SECTION_RULE}\nChecking for old LaunchAgents...\n{_SECTION_RULE}")
     old_labels = [
         "com.payetteforward.bouncewatcher",
         "com.yourusername.bouncewatcher",
     ]
-    plist_dir = Path.home() / "Library" / "LaunchAgents"
+    plist_dir = _HOME / "Library" / "LaunchAgents"
     for old_label in old_labels:
         old_plist = plist_dir / f"{old_label}.plist"
         if old_plist.exists():
@@ -894,9 +1145,7 @@ def uninstall_bounce_watcher():
                 print(f"✗ {errors[-1]}")
 
     # Summary
-    print("\n" + "=" * 80)
-    print("UNINSTALL SUMMARY")
-    print("=" * 80)
+    print(f"\n{_HEADER_RULE}\nUNINSTALL SUMMARY\n{_HEADER_RULE}")
 
     if removed_items:
         print(f"\n✓ Successfully removed {len(removed_items)} item(s):")
@@ -922,39 +1171,52 @@ def uninstall_bounce_watcher():
     print()
 
 
+def _print_help():
+    """Print command line usage for bounce-config."""
+    print("Bounce Watcher Configuration Utility")
+    print("\nUsage:")
+    print("  bounce-config                Run interactive configuration wizard")
+    print("                               (supports selective editing of existing config)")
+    print("  bounce-config --status       Show current status")
+    print("  bounce-config --test         Test current configuration")
+    print("  bounce-config --uninstall    Completely remove Bounce Watcher")
+    print("  bounce-config --help         Show this help message")
+    print("\nSelective Configuration:")
+    print("  If you have an existing configuration, bounce-config will let you:")
+    print("  - Edit only specific sections (e.g., just change destination folder)")
+    print("  - Keep all other settings unchanged")
+    print("  - No need to re-enter server names, passwords, etc.")
+
+
+# Command line options and their handlers
+_COMMANDS = {
+    "--status": show_status,
+    "-s": show_status,
+    "--test": test_configuration,
+    "-t": test_configuration,
+    "--uninstall": uninstall_bounce_watcher,
+    "-u": uninstall_bounce_watcher,
+    "--help": _print_help,
+    "-h": _print_help,
+}
+
+
 def main():
     """Main entry point for bounce-config utility."""
+    # Show output as it is printed, even when stdout is a pipe
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+
     # Parse command line arguments
     if len(sys.argv) > 1:
         arg = sys.argv[1].lower()
-        if arg in ["--status", "-s"]:
-            show_status()
-            return
-        elif arg in ["--test", "-t"]:
-            test_configuration()
-            return
-        elif arg in ["--uninstall", "-u"]:
-            uninstall_bounce_watcher()
-            return
-        elif arg in ["--help", "-h"]:
-            print("Bounce Watcher Configuration Utility")
-            print("\nUsage:")
-            print("  bounce-config                Run interactive configuration wizard")
-            print("                               (supports selective editing of existing config)")
-            print("  bounce-config --status       Show current status")
-            print("  bounce-config --test         Test current configuration")
-            print("  bounce-config --uninstall    Completely remove Bounce Watcher")
-            print("  bounce-config --help         Show this help message")
-            print("\nSelective Configuration:")
-            print("  If you have an existing configuration, bounce-config will let you:")
-            print("  - Edit only specific sections (e.g., just change destination folder)")
-            print("  - Keep all other settings unchanged")
-            print("  - No need to re-enter server names, passwords, etc.")
-            return
-        else:
+        handler = _COMMANDS.get(arg)
+        if handler is None:
             print(f"Unknown option: {arg}")
             print("Run 'bounce-config --help' for usage information.")
             sys.exit(1)
+        handler()
+        return
 
     # Run interactive wizard
     run_interactive_wizard()
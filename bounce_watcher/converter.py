@@ -4,15 +4,24 @@ Audio file conversion for Bounce Watcher.
 Orchestrates the conversion of audio files using the convert_mix.sh script.
 """
 
+import os
+import stat
 import subprocess
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
 
+from .config import Config
 from .utils import format_file_size, format_duration
 
 
+# convert_mix.sh ends a successful run with this line, followed by the path
+# of the M4A it wrote
+_OUTPUT_MARKER = "Output file: "
+
+
 class ConversionError(Exception):
     """Raised when audio conversion fails."""
     pass
@@ -35,6 +44,7 @@ class AudioConverter:
         """
         self.config = config
         self.sample_rate = config.get("sample_rate", 48000)
+        self.parallel_jobs = max(1, config.get("parallel_jobs", Config.DEFAULTS["conversion"]["parallel_jobs"]))
         self.script_path = script_dir / "scripts" / "convert_mix.sh"
         self.logger = logging.getLogger("bounce_watcher.converter")
 
@@ -44,6 +54,10 @@ class AudioConverter:
         if not self.script_path.is_file():
             raise ConversionError(f"Conversion script is not a file: {self.script_path}")
 
+        # Arguments that are the same for every conversion
+        self._script_path_str = str(self.script_path)
+        self._sample_rate_str = str(self.sample_rate)
+
     def convert(self, input_file: str, output_file: str) -> None:
         """
         Convert audio file from WAV/AIFF to M4A.
@@ -55,22 +69,27 @@ class AudioConverter:
         Raises:
             ConversionError: If conversion fails
         """
-        input_path = Path(input_file)
         output_path = Path(output_file)
+        input_name = os.path.basename(input_file)
 
-        # Validate input file
-        if not input_path.exists():
+        # Validate input file (one stat, also used for the size)
+        try:
+            input_stat = os.stat(input_file)
+        except FileNotFoundError:
             raise ConversionError(f"Input file does not exist: {input_file}")
-        if not input_path.is_file():
+        except OSError as e:
+            raise ConversionError(f"Cannot read input file {input_file}: {e}")
+        if not stat.S_ISREG(input_stat.st_mode):
             raise ConversionError(f"Input path is not a file: {input_file}")
 
         # Get input file size for logging
-        input_size = input_path.stat().st_size
+        input_size = input_stat.st_size
 
-        self.logger.info(f"Starting conversion: {input_path.name} ({format_file_size(input_size)})")
-        self.logger.debug(f"Input: {input_file}")
-        self.logger.debug(f"Output directory: {output_path.parent}")
-        self.logger.debug(f"Sample rate: {self.sample_rate} Hz")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Starting conversion: %s (%s)", input_name, format_file_size(input_size))
+        self.logger.debug("Input: %s", input_file)
+        self.logger.debug("Output directory: %s", output_path.parent)
+        self.logger.debug("Sample rate: %s Hz", self.sample_rate)
 
         # Ensure output directory exists
         output_dir = output_path.parent
@@ -79,43 +98,30 @@ class AudioConverter:
         # Run conversion script (pass directory, not full file path)
         start_time = time.time()
         try:
-            result = subprocess.run(
-                [
-                    str(self.script_path),
-                    str(input_path),
-                    str(output_dir),  # Script expects directory, not file path
-                    str(self.sample_rate)
-                ],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            # Script may have created a unique filename; it reports the
+            # file it actually wrote
+            actual_output = self._run_script([
+                self._script_path_str,
+                input_file,
+                str(output_dir),  # Script expects directory, not file path
+                self._sample_rate_str
+            ])
 
             duration = time.time() - start_time
 
-            # Script may have created a unique filename, so find the actual output file
-            # Look for files matching the base name in the output directory
-            base_name = input_path.stem  # filename without extension
-            output_files = list(output_dir.glob(f"{base_name}*.m4a"))
-
-            # Find the most recently modified file matching the pattern
-            if output_files:
-                actual_output = max(output_files, key=lambda p: p.stat().st_mtime)
-                output_size = actual_output.stat().st_size
-                compression_ratio = (1 - output_size / input_size) * 100 if input_size > 0 else 0
+            if actual_output is None:
+                raise ConversionError(f"Conversion script did not report an output file in {output_dir}")
 
+            if self.logger.isEnabledFor(logging.INFO):
+                output_size = os.stat(actual_output).st_size
+                compression_ratio = (1 - output_size / input_size) * 100 if input_size > 0 else 0.0
                 self.logger.info(
-                    f"Conversion complete: {actual_output.name} "
-                    f"({format_file_size(output_size)}, "
-                    f"{compression_ratio:.1f}% smaller, "
-                    f"took {format_duration(duration)})"
+                    "Conversion complete: %s (%s, %.1f%% smaller, took %s)",
+                    os.path.basename(actual_output),
+                    format_file_size(output_size),
+                    compression_ratio,
+                    format_duration(duration)
                 )
-            else:
-                raise ConversionError(f"Output file was not created in {output_dir}")
-
-            # Log conversion script output if in debug mode
-            if result.stdout:
-                self.logger.debug(f"Script output: {result.stdout}")
 
         except subprocess.CalledProcessError as e:
             duration = time.time() - start_time
@@ -127,9 +133,59 @@ class AudioConverter:
             self.logger.error(f"Conversion failed after {format_duration(duration)}: {e}")
             raise ConversionError(f"Conversion failed: {e}")
 
+    def _run_script(self, args: List[str]) -> Optional[str]:
+        """
+        Run the conversion script, streaming its output to the debug log.
+
+        Script output is only logged when debug logging is on; stderr is
+        kept for the error message.
+
+        Args:
+            args: Command line for the conversion script
+
+        Returns:
+            Path of the file the script reported writing, or None
+
+        Raises:
+            subprocess.CalledProcessError: If the script exits with an error
+        """
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        process = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            # Paths round-trip even if they aren't valid UTF-8
+            encoding="utf-8",
+            errors="surrogateescape"
+        )
+
+        reported = []
+
+        def read_output():
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                if line.startswith(_OUTPUT_MARKER):
+                    reported.append(line[len(_OUTPUT_MARKER):])
+                if debug:
+                    self.logger.debug("Script output: %s", line)
+
+        reader = threading.Thread(target=read_output, daemon=True)
+        reader.start()
+
+        stderr = process.stderr.read()
+        returncode = process.wait()
+        reader.join()
+        process.stderr.close()
+        process.stdout.close()
+
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, args, stderr=stderr)
+        return reported[-1] if reported else None
+
     def __repr__(self) -> str:
         """String representation of audio converter."""
-        return f"AudioConverter(sample_rate={self.sample_rate})"
+        return f"AudioConverter(sample_rate={self.sample_rate}, parallel_jobs={self.parallel_jobs})"
 
 
 def get_audio_converter(config: Dict[str, Any], script_dir: Path) -> AudioConverter:
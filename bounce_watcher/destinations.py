@@ -5,11 +5,15 @@ Handles iCloud and NAS destinations, including SMB mounting with keychain
 authentication.
 """
 
+import re
+import stat
 import subprocess
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
-from urllib.parse import urlparse
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import unquote, urlparse
 
 
 class DestinationError(Exception):
@@ -22,6 +26,20 @@ class KeychainError(Exception):
     pass
 
 
+# An SMB line of `mount` output: "//user@server/share on /mount/point (smbfs, ...)"
+_SMB_MOUNT_RE = re.compile(
+    r"^//(?:[^@/\s]+@)?(?P<server>[^/\s]+)/(?P<share>\S*) on (?P<mount_point>.+?) \(",
+    re.MULTILINE
+)
+
+# Unmount errors that just mean the share was not mounted to begin with
+_NOT_MOUNTED_MARKERS = ("not currently mounted", "not mounted", "unable to find disk")
+
+# Keychain passwords already read by this process, per (account, server)
+_password_cache: Dict[Tuple[str, str], str] = {}
+_password_cache_lock = threading.Lock()
+
+
 class DestinationManager:
     """
     Manages output destinations for converted files.
@@ -29,6 +47,15 @@ class DestinationManager:
     Supports iCloud Downloads and NAS (SMB) destinations.
     """
 
+    # Seconds a captured `mount` table is reused before running `mount` again
+    MOUNT_CACHE_TTL = 1.0
+
+    # Seconds a checked destination base folder is trusted without checking again
+    DEST_VERIFY_TTL = 5.0
+
+    # Seconds to wait for a new NAS mount to appear and become accessible
+    MOUNT_VERIFY_TIMEOUT = 5.0
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize destination manager.
@@ -50,6 +77,35 @@ class DestinationManager:
         # Custom folder settings
         self.custom_path = config.get("custom_path", "")
 
+        # (monotonic time captured, `mount` output); cleared on mount/unmount
+        self._mount_cache: Optional[Tuple[float, str]] = None
+
+        # Base folder last found usable, and when (monotonic)
+        self._dest_verified_path = ""
+        self._dest_verified_at = 0.0
+        # Session folder paths already created under the verified base folder
+        self._session_folders: Dict[str, str] = {}
+
+        # Conversions run on several threads; this serializes mounting the
+        # NAS, creating session folders and the caches above
+        self._lock = threading.Lock()
+
+    @property
+    def nas_url(self) -> str:
+        """NAS URL (smb://server/share); its parts are parsed once when it is set."""
+        return self._nas_url
+
+    @nas_url.setter
+    def nas_url(self, value: str) -> None:
+        self._nas_url = value
+        parsed = urlparse(value)
+        self._nas_scheme = parsed.scheme
+        self._nas_server = parsed.netloc
+        self._nas_share = parsed.path.lstrip("/")
+        # Case-insensitive forms for matching against `mount` output
+        self._nas_server_key = (parsed.hostname or "").lower()
+        self._nas_share_key = unquote(self._nas_share).lower()
+
     def get_destination_path(self, session_name: str) -> str:
         """
         Get destination path for a given session.
@@ -63,14 +119,15 @@ class DestinationManager:
         Raises:
             DestinationError: If destination is not available
         """
-        if self.mode == "icloud":
-            return self._get_icloud_destination(session_name)
-        elif self.mode == "nas":
-            return self._get_nas_destination(session_name)
-        elif self.mode == "custom":
-            return self._get_custom_destination(session_name)
-        else:
-            raise DestinationError(f"Invalid destination mode: {self.mode}")
+        with self._lock:
+            if self.mode == "icloud":
+                return self._get_icloud_destination(session_name)
+            elif self.mode == "nas":
+                return self._get_nas_destination(session_name)
+            elif self.mode == "custom":
+                return self._get_custom_destination(session_name)
+            else:
+                raise DestinationError(f"Invalid destination mode: {self.mode}")
 
     def _get_icloud_destination(self, session_name: str) -> str:
         """
@@ -88,14 +145,13 @@ class DestinationManager:
         if not self.icloud_path:
             raise DestinationError("iCloud path not configured")
 
-        icloud_path = Path(self.icloud_path)
-        if not icloud_path.exists():
-            raise DestinationError(f"iCloud path does not exist: {self.icloud_path}")
+        if not self._recently_verified(self.icloud_path):
+            icloud_path = Path(self.icloud_path)
+            if not icloud_path.exists():
+                raise DestinationError(f"iCloud path does not exist: {self.icloud_path}")
+            self._mark_verified(self.icloud_path)
 
-        session_folder = icloud_path / session_name
-        session_folder.mkdir(exist_ok=True)
-
-        return str(session_folder.absolute())
+        return self._make_session_folder(self.icloud_path, session_name)
 
     def _get_custom_destination(self, session_name: str) -> str:
         """
@@ -113,17 +169,16 @@ class DestinationManager:
         if not self.custom_path:
             raise DestinationError("Custom path not configured")
 
-        custom_path = Path(self.custom_path)
-        if not custom_path.exists():
-            raise DestinationError(f"Custom path does not exist: {self.custom_path}")
-
-        if not custom_path.is_dir():
-            raise DestinationError(f"Custom path is not a directory: {self.custom_path}")
+        if not self._recently_verified(self.custom_path):
+            custom_path = Path(self.custom_path)
+            if not custom_path.exists():
+                raise DestinationError(f"Custom path does not exist: {self.custom_path}")
 
-        session_folder = custom_path / session_name
-        session_folder.mkdir(exist_ok=True)
+            if not custom_path.is_dir():
+                raise DestinationError(f"Custom path is not a directory: {self.custom_path}")
+            self._mark_verified(self.custom_path)
 
-        return str(session_folder.absolute())
+        return self._make_session_folder(self.custom_path, session_name)
 
     def _get_nas_destination(self, session_name: str) -> str:
         """
@@ -140,20 +195,106 @@ class DestinationManager:
         Raises:
             DestinationError: If NAS cannot be mounted or accessed
         """
-        # Ensure NAS is mounted (this will update nas_mount_point if needed)
-        self.ensure_nas_mounted()
+        # A mount checked moments ago is trusted; creating the session
+        # folder fails (and clears that trust) if it has since gone away
+        if not self._recently_verified(self.nas_mount_point):
+            # Ensure NAS is mounted (this will update nas_mount_point if needed)
+            self.ensure_nas_mounted()
 
-        if not self.nas_mount_point:
-            raise DestinationError("NAS mount point not found after mounting")
+            if not self.nas_mount_point:
+                raise DestinationError("NAS mount point not found after mounting")
 
-        mount_path = Path(self.nas_mount_point)
-        if not mount_path.exists():
-            raise DestinationError(f"NAS mount point does not exist: {self.nas_mount_point}")
+            mount_path = Path(self.nas_mount_point)
+            if not mount_path.exists():
+                raise DestinationError(f"NAS mount point does not exist: {self.nas_mount_point}")
+            self._mark_verified(self.nas_mount_point)
 
-        session_folder = mount_path / session_name
-        session_folder.mkdir(exist_ok=True)
+        return self._make_session_folder(self.nas_mount_point, session_name)
 
-        return str(session_folder.absolute())
+    def _recently_verified(self, base_path: str) -> bool:
+        """
+        Check whether a destination base folder was found usable within DEST_VERIFY_TTL.
+
+        Args:
+            base_path: Destination base folder
+
+        Returns:
+            True if the folder's checks can be skipped
+        """
+        return (
+            bool(base_path)
+            and base_path == self._dest_verified_path
+            and time.monotonic() - self._dest_verified_at < self.DEST_VERIFY_TTL
+        )
+
+    def _mark_verified(self, base_path: str) -> None:
+        """
+        Record that a destination base folder passed its checks.
+
+        Args:
+            base_path: Destination base folder
+        """
+        if base_path != self._dest_verified_path:
+            self._session_folders.clear()
+        self._dest_verified_path = base_path
+        self._dest_verified_at = time.monotonic()
+
+    def _make_session_folder(self, base_path: str, session_name: str) -> str:
+        """
+        Create (if needed) the session folder under a destination base folder.
+
+        Args:
+            base_path: Destination base folder
+            session_name: Name of the Pro Tools session
+
+        Returns:
+            Absolute path to the session folder
+        """
+        # Files from one session usually arrive in a batch; while the base
+        # folder is freshly verified, reuse the folder created for the first
+        cached = self._session_folders.get(session_name)
+        if cached is not None and self._recently_verified(base_path):
+            return cached
+
+        session_folder = Path(base_path) / session_name
+        try:
+            session_folder.mkdir(exist_ok=True)
+        except OSError:
+            # The base folder may have gone away; check it fully next time
+            self._dest_verified_at = 0.0
+            self._session_folders.clear()
+            raise
+
+        folder = str(session_folder.absolute())
+        self._session_folders[session_name] = folder
+        return folder
+
+    def _get_mount_output(self) -> str:
+        """
+        Get the current mount table, reusing a capture younger than MOUNT_CACHE_TTL.
+
+        Returns:
+            Output of the `mount` command
+
+        Raises:
+            subprocess.CalledProcessError: If `mount` fails
+        """
+        now = time.monotonic()
+        if self._mount_cache is not None and now - self._mount_cache[0] < self.MOUNT_CACHE_TTL:
+            return self._mount_cache[1]
+
+        result = subprocess.run(
+            ["mount"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self._mount_cache = (now, result.stdout)
+        return result.stdout
+
+    def _invalidate_mount_cache(self) -> None:
+        """Forget the captured mount table after mounting or unmounting."""
+        self._mount_cache = None
 
     def is_nas_mounted(self, check_accessibility: bool = True) -> bool:
         """
@@ -168,54 +309,44 @@ class DestinationManager:
         if not self.nas_url:
             return False
 
-        # Parse the NAS URL to get the share name
-        parsed = urlparse(self.nas_url)
-        server = parsed.netloc
-        share = parsed.path.lstrip("/")
+        server = self._nas_server_key
+        share = self._nas_share_key
 
         # Check mount output for the server/share
         try:
-            result = subprocess.run(
-                ["mount"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            # Look for the server in mount output
-            # Mount output will show something like: //username@server.local/share on /Volumes/share
-            for line in result.stdout.splitlines():
-                if server in line and share in line.lower():
-                    # Extract the actual mount point from the line
-                    # Format: "//user@server/share on /mount/point (smbfs, ...)"
-                    if " on " in line:
-                        parts = line.split(" on ")
-                        if len(parts) >= 2:
-                            mount_point = parts[1].split(" (")[0].strip()
-                            # Update our mount point to match reality
-                            self.nas_mount_point = mount_point
-
-                            # Verify the mount is actually accessible if requested
-                            if check_accessibility:
-                                mount_path = Path(mount_point)
-                                # Try to list directory to verify it's not stale
-                                try:
-                                    # If we can access it, it's truly mounted
-                                    if mount_path.exists() and os.access(mount_path, os.R_OK | os.W_OK):
-                                        return True
-                                    else:
-                                        # Mount exists but is stale
-                                        return False
-                                except (OSError, PermissionError):
-                                    # Mount is stale/inaccessible
-                                    return False
-                            else:
-                                return True
+            mount_output = self._get_mount_output()
+
+            for match in _SMB_MOUNT_RE.finditer(mount_output):
+                if match["server"].lower() != server:
+                    continue
+                if share and unquote(match["share"]).lower() != share:
+                    continue
+
+                # Update our mount point to match reality
+                mount_point = match["mount_point"]
+                self.nas_mount_point = mount_point
+
+                # Verify the mount is actually accessible if requested
+                if check_accessibility:
+                    mount_path = Path(mount_point)
+                    # Try to list directory to verify it's not stale
+                    try:
+                        # If we can access it, it's truly mounted
+                        if mount_path.exists() and os.access(mount_path, os.R_OK | os.W_OK):
+                            return True
+                        else:
+                            # Mount exists but is stale
+                            return False
+                    except (OSError, PermissionError):
+                        # Mount is stale/inaccessible
+                        return False
+                else:
+                    return True
 
             # Also check if our configured mount point exists
             if self.nas_mount_point:
                 mount_path = Path(self.nas_mount_point)
-                if mount_path.exists() and str(mount_path) in result.stdout:
+                if mount_path.exists() and str(mount_path) in mount_output:
                     if check_accessibility:
                         try:
                             return os.access(mount_path, os.R_OK | os.W_OK)
@@ -271,13 +402,12 @@ class DestinationManager:
         if not self.nas_mount_point:
             raise DestinationError("NAS mount point not configured")
 
-        # Parse NAS URL to get server and share
-        parsed = urlparse(self.nas_url)
-        if parsed.scheme != "smb":
-            raise DestinationError(f"Invalid NAS URL scheme: {parsed.scheme} (expected 'smb')")
+        # Server and share were parsed when nas_url was set
+        if self._nas_scheme != "smb":
+            raise DestinationError(f"Invalid NAS URL scheme: {self._nas_scheme} (expected 'smb')")
 
-        server = parsed.netloc
-        share = parsed.path.lstrip("/")
+        server = self._nas_server
+        share = self._nas_share
 
         if not server:
             raise DestinationError(f"Invalid NAS URL: {self.nas_url}")
@@ -288,18 +418,20 @@ class DestinationManager:
         except KeychainError as e:
             raise DestinationError(f"Failed to get NAS password from keychain: {e}")
 
-        # Build SMB URL with credentials
-        if share:
-            smb_url = f"smb://{self.nas_username}:{password}@{server}/{share}"
-        else:
-            smb_url = f"smb://{self.nas_username}:{password}@{server}"
+        # Credentials are passed separately rather than embedded in the URL,
+        # so special characters in the password need no URL encoding
+        smb_url = f"smb://{server}/{share}" if share else f"smb://{server}"
+
+        volume = _applescript_string(smb_url)
+        user_name = _applescript_string(self.nas_username)
+        secret = _applescript_string(password)
 
         # Use osascript to mount via Finder, which handles mount point creation
         # This is the macOS-native way and doesn't require sudo
         applescript = f'''
         tell application "Finder"
             try
-                mount volume "{smb_url}"
+                mount volume {volume} as user name {user_name} with password {secret}
             on error errMsg
                 error errMsg
             end try
@@ -307,20 +439,19 @@ class DestinationManager:
         '''
 
         try:
-            result = subprocess.run(
-                ["osascript", "-e", applescript],
+            # The script is fed on stdin so the password never shows up in
+            # the process list (argv is visible to every user via ps)
+            subprocess.run(
+                ["osascript", "-"],
+                input=applescript,
                 capture_output=True,
                 text=True,
                 check=True,
                 timeout=30
             )
 
-            # Wait a moment for mount to complete
-            import time
-            time.sleep(2)
-
             # Verify it mounted and is accessible
-            if not self.is_nas_mounted(check_accessibility=True):
+            if not self._wait_for_mount():
                 raise DestinationError("Mount command succeeded but NAS is not accessible")
 
             print(f"Successfully mounted NAS at {self.nas_mount_point}")
@@ -332,17 +463,43 @@ class DestinationManager:
             # Clean up password from error message for security
             error_msg = error_msg.replace(password, "***")
 
+            # The keychain entry may have changed since it was cached
+            _forget_cached_password(self.nas_username, server)
+
             # If retry is enabled and error suggests mount already exists, try cleaning up
             if retry and ("already" in error_msg.lower() or "in use" in error_msg.lower()):
                 print(f"Mount failed (possibly stale mount), attempting cleanup and retry...")
                 self._force_unmount_nas()
-                import time
                 time.sleep(1)
                 # Retry once without retry flag to avoid infinite loop
                 return self.mount_nas(retry=False)
 
             raise DestinationError(f"Failed to mount NAS: {error_msg}")
 
+    def _wait_for_mount(self) -> bool:
+        """
+        Poll until the NAS shows up as mounted and accessible.
+
+        Starts with short waits and backs off, so a quick mount is seen
+        almost at once while a slow one gets up to MOUNT_VERIFY_TIMEOUT.
+
+        Returns:
+            True if the mount became accessible in time, False otherwise
+        """
+        deadline = time.monotonic() + self.MOUNT_VERIFY_TIMEOUT
+        delay = 0.05
+        while True:
+            # The mount table is changing, so never reuse an earlier capture
+            self._invalidate_mount_cache()
+            if self.is_nas_mounted(check_accessibility=True):
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 0.5)
+
     def unmount_nas(self) -> None:
         """
         Unmount NAS gracefully.
@@ -350,22 +507,27 @@ class DestinationManager:
         Raises:
             DestinationError: If unmounting fails
         """
-        if not self.is_nas_mounted(check_accessibility=False):
+        if not self.nas_mount_point:
             return
 
-        try:
-            # Try graceful unmount first
-            subprocess.run(
-                ["diskutil", "unmount", self.nas_mount_point],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10
-            )
+        # Just try the unmount: a share that isn't mounted is reported as
+        # such, so there is no need to list mounts first
+        result = subprocess.run(
+            ["diskutil", "unmount", self.nas_mount_point],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        self._invalidate_mount_cache()
+
+        if result.returncode == 0:
             print(f"Successfully unmounted NAS from {self.nas_mount_point}")
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if e.stderr else str(e)
-            raise DestinationError(f"Failed to unmount NAS: {error_msg}")
+            return
+
+        error_msg = (result.stderr or result.stdout).strip()
+        if any(marker in error_msg.lower() for marker in _NOT_MOUNTED_MARKERS):
+            return
+        raise DestinationError(f"Failed to unmount NAS: {error_msg or f'exit status {result.returncode}'}")
 
     def _force_unmount_nas(self) -> None:
         """
@@ -385,6 +547,7 @@ class DestinationManager:
                 check=False,  # Don't raise on error
                 timeout=10
             )
+            self._invalidate_mount_cache()
             print(f"Force unmounted stale NAS mount from {self.nas_mount_point}")
         except subprocess.TimeoutExpired:
             # If even force unmount times out, log it but continue
@@ -402,15 +565,13 @@ class DestinationManager:
         """
         try:
             if self.mode == "icloud":
-                path = Path(self.icloud_path)
-                return path.exists() and path.is_dir() and os.access(path, os.W_OK)
+                return _writable_dir(self.icloud_path)
             elif self.mode == "nas":
-                self.ensure_nas_mounted()
-                path = Path(self.nas_mount_point)
-                return path.exists() and path.is_dir() and os.access(path, os.W_OK)
+                with self._lock:
+                    self.ensure_nas_mounted()
+                return _writable_dir(self.nas_mount_point)
             elif self.mode == "custom":
-                path = Path(self.custom_path)
-                return path.exists() and path.is_dir() and os.access(path, os.W_OK)
+                return _writable_dir(self.custom_path)
             return False
         except Exception as e:
             print(f"Destination test failed: {e}")
@@ -421,10 +582,47 @@ class DestinationManager:
         return f"DestinationManager(mode={self.mode})"
 
 
+def _writable_dir(path: str) -> bool:
+    """
+    Check that a path is a directory this process can write to.
+
+    One stat for the directory check; os.access asks the kernel, so ACLs,
+    read-only mounts and root are handled the way a real write would be.
+
+    Args:
+        path: Directory to check
+
+    Returns:
+        True if path is a writable directory, False otherwise
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and os.access(path, os.W_OK)
+
+
+def _applescript_string(value: str) -> str:
+    """
+    Quote a value as an AppleScript string literal.
+
+    Args:
+        value: Text to quote
+
+    Returns:
+        The value in double quotes, with backslashes and quotes escaped
+    """
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
 def get_keychain_password(account: str, server: str) -> str:
     """
     Retrieve password from macOS keychain.
 
+    The result is cached for the life of the process, so repeated NAS
+    mounts don't each run `security`.
+
     Args:
         account: Account/username
         server: Server name
@@ -435,6 +633,12 @@ def get_keychain_password(account: str, server: str) -> str:
     Raises:
         KeychainError: If password cannot be retrieved
     """
+    key = (account, server)
+    with _password_cache_lock:
+        password = _password_cache.get(key)
+    if password is not None:
+        return password
+
     try:
         result = subprocess.run(
             [
@@ -451,6 +655,8 @@ def get_keychain_password(account: str, server: str) -> str:
         password = result.stdout.strip()
         if not password:
             raise KeychainError("Password is empty")
+        with _password_cache_lock:
+            _password_cache[key] = password
         return password
     except subprocess.CalledProcessError as e:
         if "password could not be found" in e.stderr.lower():
@@ -459,6 +665,18 @@ def get_keychain_password(account: str, server: str) -> str:
             raise KeychainError(f"Failed to retrieve password: {e.stderr.strip()}")
 
 
+def _forget_cached_password(account: str, server: str) -> None:
+    """
+    Drop a cached keychain password so the next lookup asks the keychain again.
+
+    Args:
+        account: Account/username
+        server: Server name
+    """
+    with _password_cache_lock:
+        _password_cache.pop((account, server), None)
+
+
 def set_keychain_password(account: str, server: str, password: str) -> None:
     """
     Store password in macOS keychain.
@@ -471,6 +689,7 @@ def set_keychain_password(account: str, server: str, password: str) -> None:
     Raises:
         KeychainError: If password cannot be stored
     """
+    _forget_cached_password(account, server)
     try:
         # Use -U to update if exists, otherwise create
         subprocess.run(
@@ -501,6 +720,7 @@ def delete_keychain_password(account: str, server: str) -> None:
     Raises:
         KeychainError: If password cannot be deleted
     """
+    _forget_cached_password(account, server)
     try:
         subprocess.run(
             [
@@ -6,10 +6,12 @@ updates the file watching.
 """
 
 import logging
+import os
+import queue
+import threading
 import time
 from pathlib import Path
-from typing import Set, Callable, Optional
-from watchdog.observers import Observer
+from typing import Dict, Set, Callable, Optional, Tuple
 from watchdog.events import FileSystemEventHandler, DirCreatedEvent, DirDeletedEvent
 
 from .sources import SourceManager, DriveInfo
@@ -24,6 +26,12 @@ class DriveEventHandler(FileSystemEventHandler):
     drives are connected or disconnected.
     """
 
+    # Seconds a drive check result is reused for repeated events on one mount point
+    VALIDATION_CACHE_TTL = 2.0
+
+    # Seconds to let a mount settle; events arriving meanwhile are coalesced
+    SETTLE_DELAY = 1.0
+
     def __init__(
         self,
         source_manager: SourceManager,
@@ -44,6 +52,17 @@ class DriveEventHandler(FileSystemEventHandler):
         self.on_drive_removed = on_drive_removed
         self.logger = logging.getLogger("bounce_watcher.drive_monitor")
         self.monitored_drives: Set[str] = set()
+        # mount point -> (monotonic time checked, is valid external drive)
+        self._validation_cache: Dict[str, Tuple[float, bool]] = {}
+
+        # Events are handled off the observer thread; None stops the worker
+        self._events: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue(maxsize=64)
+        self._worker = threading.Thread(
+            target=self._process_events,
+            name="drive-events",
+            daemon=True
+        )
+        self._worker.start()
 
     def on_created(self, event):
         """
@@ -58,19 +77,80 @@ class DriveEventHandler(FileSystemEventHandler):
         mount_point = event.src_path
 
         # Skip hidden directories
-        if Path(mount_point).name.startswith('.'):
+        if os.path.basename(mount_point).startswith('.'):
             return
 
-        # Give the system a moment to finish mounting
-        time.sleep(1)
+        self._events.put(("created", mount_point))
 
+    def on_deleted(self, event):
+        """
+        Handle directory deletion in /Volumes (drive unmounted).
+
+        Args:
+            event: File system event
+        """
+        if not isinstance(event, DirDeletedEvent):
+            return
+
+        self._events.put(("deleted", event.src_path))
+
+    def stop(self):
+        """Stop the event worker once queued events have been handled."""
+        self._events.put(None)
+        self._worker.join()
+
+    def _process_events(self):
+        """
+        Worker loop: handle queued drive events until stopped.
+
+        After the first event, waits SETTLE_DELAY for the mount to finish,
+        keeping only the latest event per mount point, then handles them.
+        """
+        running = True
+        while running:
+            item = self._events.get()
+            if item is None:
+                break
+
+            pending = {item[1]: item[0]}
+            deadline = time.monotonic() + self.SETTLE_DELAY
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._events.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                pending[item[1]] = item[0]
+
+            for mount_point, kind in pending.items():
+                try:
+                    if kind == "created":
+                        self._handle_drive_added(mount_point)
+                    else:
+                        self._handle_drive_removed(mount_point)
+                except Exception as e:
+                    self.logger.error(f"Error handling drive event for {mount_point}: {e}")
+
+    def _handle_drive_added(self, mount_point: str):
+        """
+        Start monitoring a newly mounted volume if it is a valid external drive.
+
+        Args:
+            mount_point: Mount point of the new volume
+        """
         # Check if this is a valid external drive
         if self._is_valid_external_drive(mount_point):
             self.logger.info(f"New external drive detected: {mount_point}")
             self.monitored_drives.add(mount_point)
+            self.source_manager.refresh()
 
             # Notify user
-            drive_name = Path(mount_point).name
+            drive_name = os.path.basename(mount_point)
             send_notification(
                 "Bounce Watcher",
                 f"Now monitoring: {drive_name}",
@@ -80,25 +160,21 @@ class DriveEventHandler(FileSystemEventHandler):
             # Trigger callback
             self.on_drive_added(mount_point)
 
-    def on_deleted(self, event):
+    def _handle_drive_removed(self, mount_point: str):
         """
-        Handle directory deletion in /Volumes (drive unmounted).
+        Stop monitoring a volume that was unmounted.
 
         Args:
-            event: File system event
+            mount_point: Mount point of the removed volume
         """
-        if not isinstance(event, DirDeletedEvent):
-            return
-
-        mount_point = event.src_path
-
         # Only process if we were monitoring this drive
         if mount_point in self.monitored_drives:
             self.logger.info(f"External drive disconnected: {mount_point}")
             self.monitored_drives.remove(mount_point)
+            self.source_manager.refresh()
 
             # Notify user
-            drive_name = Path(mount_point).name
+            drive_name = os.path.basename(mount_point)
             send_notification(
                 "Bounce Watcher",
                 f"Stopped monitoring: {drive_name}",
@@ -118,28 +194,30 @@ class DriveEventHandler(FileSystemEventHandler):
         Returns:
             True if valid external drive, False otherwise
         """
-        if not Path(mount_point).exists():
-            return False
-
-        # Detect all drives and find this one
-        drives = self.source_manager._detect_external_drives()
-
-        for drive in drives:
-            if drive.mount_point == mount_point:
+        now = time.monotonic()
+        cached = self._validation_cache.get(mount_point)
+        if cached is not None and now - cached[0] < self.VALIDATION_CACHE_TTL:
+            return cached[1]
+
+        is_valid = False
+        if Path(mount_point).exists():
+            # Inspect just this volume rather than rescanning /Volumes
+            drive = self.source_manager.inspect_mount_point(mount_point)
+            if drive is not None:
                 # Apply smart filtering
-                filtered = self.source_manager._apply_smart_filtering([drive])
-                return len(filtered) > 0
+                is_valid = len(self.source_manager._apply_smart_filtering([drive])) > 0
 
-        return False
+        self._validation_cache[mount_point] = (now, is_valid)
+        return is_valid
 
     def initialize_monitored_drives(self, current_drives: list):
         """
         Initialize the set of currently monitored drives.
 
         Args:
-            current_drives: List of currently mounted drive paths
+            current_drives: List of currently mounted drive paths (str or Path)
         """
-        self.monitored_drives = set(current_drives)
+        self.monitored_drives = {str(drive) for drive in current_drives}
         self.logger.info(f"Initialized with {len(current_drives)} drive(s)")
 
 
@@ -176,7 +254,9 @@ class DriveMonitor:
             on_drive_removed
         )
 
-        # Create observer for /Volumes
+        # Create observer for /Volumes (the platform observer backend is
+        # only loaded when drive monitoring is actually used)
+        from watchdog.observers import Observer
         self.observer = Observer()
         self.running = False
 
@@ -210,6 +290,7 @@ class DriveMonitor:
         if self.running:
             self.observer.stop()
             self.observer.join()
+            self.event_handler.stop()
             self.running = False
             self.logger.info("Drive monitoring stopped")
 
@@ -4,17 +4,75 @@ LaunchAgent management for Bounce Watcher.
 Handles macOS LaunchAgent service installation, configuration, and lifecycle.
 """
 
+import functools
+import os
+import re
+import shutil
 import subprocess
+import sys
 import plistlib
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 
+# "key = value" lines of interest in `launchctl print` output (matched on
+# the raw bytes, so the output never needs decoding)
+_PRINT_FIELD_RE = re.compile(rb"^\s*(pid|last exit code)\s*=\s*(-?\d+)", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=4)
+def _serialize_plist(
+    label: str,
+    program: str,
+    working_directory: str,
+    log_stdout: str,
+    log_stderr: str
+) -> bytes:
+    """
+    Build the LaunchAgent plist and serialize it.
+
+    Cached, so repeated installs with the same settings reuse the bytes.
+
+    Args:
+        label: LaunchAgent label
+        program: Path to the executable to run
+        working_directory: Working directory for the service
+        log_stdout: Path to stdout log file
+        log_stderr: Path to stderr log file
+
+    Returns:
+        Serialized plist (XML)
+    """
+    plist_dict = {
+        "Label": label,
+        "ProgramArguments": [program],
+        "WorkingDirectory": working_directory,
+        "RunAtLoad": True,
+        "KeepAlive": {
+            "SuccessfulExit": False,  # Restart on crash, not on clean exit
+        },
+        "StandardOutPath": log_stdout,
+        "StandardErrorPath": log_stderr,
+        "ProcessType": "Background",
+    }
+    return plistlib.dumps(plist_dict)
+
+
 class LaunchdError(Exception):
     """Raised when LaunchAgent operations fail."""
     pass
 
 
+@dataclass
+class AgentState:
+    """State of the LaunchAgent from a single probe."""
+    installed: bool
+    loaded: bool
+    pid: Optional[int] = None
+    exit_code: Optional[int] = None
+
+
 class LaunchAgentManager:
     """
     Manages macOS LaunchAgent for Bounce Watcher.
@@ -27,6 +85,10 @@ class LaunchAgentManager:
     LABEL = "com.bouncewatcher.daemon"
     PLIST_FILENAME = f"{LABEL}.plist"
 
+    # Resolved once per process; every manager uses the same location
+    PLIST_DIR = Path.home() / "Library" / "LaunchAgents"
+    PLIST_PATH = PLIST_DIR / PLIST_FILENAME
+
     def __init__(self, script_path: Optional[Path] = None):
         """
         Initialize LaunchAgent manager.
@@ -35,26 +97,19 @@ class LaunchAgentManager:
             script_path: Path to bounce-watcher executable. If None, uses 'bounce-watcher' in PATH.
         """
         self.label = self.LABEL
-        self.plist_dir = Path.home() / "Library" / "LaunchAgents"
-        self.plist_path = self.plist_dir / self.PLIST_FILENAME
+        self.plist_dir = self.PLIST_DIR
+        self.plist_path = self.PLIST_PATH
+        # launchd service target for `launchctl print` in the user's GUI domain
+        self.service_target = f"gui/{os.getuid()}/{self.label}"
 
         # Determine script path
         if script_path:
             self.script_path = Path(script_path)
         else:
-            # Try to find bounce-watcher in PATH
-            try:
-                result = subprocess.run(
-                    ["which", "bounce-watcher"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                self.script_path = Path(result.stdout.strip())
-            except subprocess.CalledProcessError:
-                # Default to Python module execution
-                import sys
-                self.script_path = Path(sys.executable)
+            # Try to find bounce-watcher in PATH, else default to Python
+            # module execution
+            found = shutil.which("bounce-watcher")
+            self.script_path = Path(found) if found else Path(sys.executable)
 
     def is_installed(self) -> bool:
         """
@@ -72,16 +127,7 @@ class LaunchAgentManager:
         Returns:
             True if service is loaded, False otherwise
         """
-        try:
-            result = subprocess.run(
-                ["launchctl", "list"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return self.label in result.stdout
-        except subprocess.CalledProcessError:
-            return False
+        return self._probe_state().loaded
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -90,61 +136,58 @@ class LaunchAgentManager:
         Returns:
             Dictionary with status information
         """
-        status = {
-            "installed": self.is_installed(),
-            "loaded": False,
-            "pid": None,
-            "exit_code": None,
-        }
+        return asdict(self._probe_state())
 
-        if not status["installed"]:
-            return status
+    def _probe_state(self) -> AgentState:
+        """
+        Check whether the agent is installed and loaded, with its PID and
+        last exit code, using one stat and one launchctl call.
 
-        # Check if loaded and get details
-        try:
-            result = subprocess.run(
-                ["launchctl", "list", self.label],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+        Returns:
+            AgentState for the LaunchAgent
+        """
+        state = AgentState(installed=self.is_installed(), loaded=False)
 
-            status["loaded"] = True
+        # Asks launchd about this one service instead of listing every agent
+        result = subprocess.run(
+            ["launchctl", "print", self.service_target],
+            capture_output=True
+        )
+        if result.returncode != 0:
+            return state
 
-            # Parse output for PID and status
-            for line in result.stdout.splitlines():
-                if '"PID"' in line:
-                    try:
-                        pid = int(line.split("=")[1].strip().rstrip(";"))
-                        status["pid"] = pid
-                    except:
-                        pass
-                elif '"LastExitStatus"' in line:
-                    try:
-                        exit_code = int(line.split("=")[1].strip().rstrip(";"))
-                        status["exit_code"] = exit_code
-                    except:
-                        pass
+        state.loaded = True
 
-        except subprocess.CalledProcessError:
-            status["loaded"] = False
+        # Parse output for PID and last exit code (first occurrence of each;
+        # a service that never ran reports "(never exited)", which won't match)
+        for match in _PRINT_FIELD_RE.finditer(result.stdout):
+            if match.group(1) == b"pid":
+                if state.pid is None:
+                    state.pid = int(match.group(2))
+            elif state.exit_code is None:
+                state.exit_code = int(match.group(2))
 
-        return status
+        return state
 
     def create_plist(
         self,
         working_directory: Optional[Path] = None,
         log_stdout: Optional[Path] = None,
         log_stderr: Optional[Path] = None
-    ) -> None:
+    ) -> bool:
         """
         Create LaunchAgent plist file.
 
+        The file is left alone if it already has exactly this content.
+
         Args:
             working_directory: Working directory for the service
             log_stdout: Path to stdout log file
             log_stderr: Path to stderr log file
 
+        Returns:
+            True if the plist was written, False if it was already up to date
+
         Raises:
             LaunchdError: If plist creation fails
         """
@@ -161,26 +204,50 @@ class LaunchAgentManager:
         if log_stderr is None:
             log_stderr = working_directory / "stderr.log"
 
-        # Build plist dictionary
-        plist_dict = {
-            "Label": self.label,
-            "ProgramArguments": [str(self.script_path)],
-            "WorkingDirectory": str(working_directory),
-            "RunAtLoad": True,
-            "KeepAlive": {
-                "SuccessfulExit": False,  # Restart on crash, not on clean exit
-            },
-            "StandardOutPath": str(log_stdout),
-            "StandardErrorPath": str(log_stderr),
-            "ProcessType": "Background",
-        }
+        plist_bytes = _serialize_plist(
+            self.label,
+            str(self.script_path),
+            str(working_directory),
+            str(log_stdout),
+            str(log_stderr)
+        )
+        try:
+            if self.plist_path.read_bytes() == plist_bytes:
+                print(f"LaunchAgent plist is up to date: {self.plist_path}")
+                return False
+        except OSError:
+            pass  # Not installed yet (or unreadable); write it
 
         # Write plist file
+        self.write_plist_atomic(plist_bytes)
+        print(f"Created LaunchAgent plist: {self.plist_path}")
+        return True
+
+    def write_plist_atomic(self, data: bytes) -> None:
+        """
+        Replace the plist file with new contents in one step.
+
+        Writes a temporary file next to the plist and renames it over the
+        original, so launchd never sees a partially written plist.
+
+        Args:
+            data: Serialized plist
+
+        Raises:
+            LaunchdError: If the file cannot be written
+        """
+        tmp_path = self.plist_path.with_suffix(".plist.tmp")
         try:
-            with open(self.plist_path, "wb") as f:
-                plistlib.dump(plist_dict, f)
-            print(f"Created LaunchAgent plist: {self.plist_path}")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.plist_path)
         except Exception as e:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             raise LaunchdError(f"Failed to create plist file: {e}")
 
     def install(
@@ -204,17 +271,24 @@ class LaunchAgentManager:
         Raises:
             LaunchdError: If installation fails
         """
-        # If already installed, unload first
-        if self.is_installed() and self.is_loaded():
-            print("Existing LaunchAgent found. Unloading...")
-            self.unload()
+        # Create plist (left untouched if nothing changed)
+        changed = self.create_plist(working_directory, log_stdout, log_stderr)
+        loaded = self.is_loaded()
 
-        # Create plist
-        self.create_plist(working_directory, log_stdout, log_stderr)
+        # A loaded service whose plist didn't change needs no reload
+        if loaded and load and not changed:
+            print(f"LaunchAgent already loaded: {self.label}")
+            print(f"LaunchAgent installed: {self.label}")
+            return
+
+        # Unload the existing service so the new plist takes effect
+        if loaded:
+            print("Existing LaunchAgent found. Unloading...")
+            self._unload()
 
         # Load if requested
         if load:
-            self.load()
+            self._load()
 
         print(f"LaunchAgent installed: {self.label}")
 
@@ -227,12 +301,14 @@ class LaunchAgentManager:
         Raises:
             LaunchdError: If uninstallation fails
         """
+        state = self._probe_state()
+
         # Unload if loaded
-        if self.is_loaded():
-            self.unload()
+        if state.loaded:
+            self._unload()
 
         # Remove plist file
-        if self.is_installed():
+        if state.installed:
             try:
                 self.plist_path.unlink()
                 print(f"Removed LaunchAgent plist: {self.plist_path}")
@@ -248,13 +324,23 @@ class LaunchAgentManager:
         Raises:
             LaunchdError: If loading fails
         """
-        if not self.is_installed():
+        state = self._probe_state()
+        if not state.installed:
             raise LaunchdError("LaunchAgent is not installed. Install it first.")
 
-        if self.is_loaded():
+        if state.loaded:
             print(f"LaunchAgent already loaded: {self.label}")
             return
 
+        self._load()
+
+    def _load(self) -> None:
+        """
+        Run `launchctl load` without checking the current state first.
+
+        Raises:
+            LaunchdError: If loading fails
+        """
         try:
             subprocess.run(
                 ["launchctl", "load", str(self.plist_path)],
@@ -278,6 +364,15 @@ class LaunchAgentManager:
             print(f"LaunchAgent not loaded: {self.label}")
             return
 
+        self._unload()
+
+    def _unload(self) -> None:
+        """
+        Run `launchctl unload` without checking the current state first.
+
+        Raises:
+            LaunchdError: If unloading fails
+        """
         try:
             subprocess.run(
                 ["launchctl", "unload", str(self.plist_path)],
@@ -297,9 +392,14 @@ class LaunchAgentManager:
         Raises:
             LaunchdError: If restart fails
         """
-        if self.is_loaded():
-            self.unload()
-        self.load()
+        # One state check; the unload/load steps don't need to re-check
+        state = self._probe_state()
+        if not state.installed:
+            raise LaunchdError("LaunchAgent is not installed. Install it first.")
+
+        if state.loaded:
+            self._unload()
+        self._load()
         print(f"Restarted LaunchAgent: {self.label}")
 
     def ensure_single_instance(self) -> None:
@@ -308,17 +408,17 @@ class LaunchAgentManager:
 
         Checks for and removes any duplicate or stale services.
         """
-        # Check for loaded service
-        if self.is_loaded():
-            status = self.get_status()
-            if status.get("pid"):
-                print(f"LaunchAgent is running (PID: {status['pid']})")
+        # Check for loaded service (the probe also tells us the PID)
+        state = self._probe_state()
+        if state.loaded:
+            if state.pid:
+                print(f"LaunchAgent is running (PID: {state.pid})")
             else:
                 print(f"LaunchAgent is loaded but not running")
 
             # If we want to update, unload first
             print("Unloading existing service before update...")
-            self.unload()
+            self._unload()
 
     def print_status(self) -> None:
         """Print human-readable status information."""
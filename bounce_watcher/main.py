@@ -8,10 +8,6 @@ import sys
 from pathlib import Path
 
 from .config import load_config, ConfigError
-from .sources import get_source_manager
-from .destinations import get_destination_manager, DestinationError
-from .converter import get_audio_converter, ConversionError
-from .watcher import BounceWatcher
 from .utils import setup_logging, send_notification
 
 
@@ -42,6 +38,14 @@ def main():
         log_level = log_config.get("level", "INFO")
         logger = setup_logging(log_file, log_level)
 
+        # Imported only once there is a configuration to run with (these
+        # pull in watchdog and the rest of the service); after logging is
+        # set up so an import failure is logged like any other error
+        from .sources import get_source_manager
+        from .destinations import get_destination_manager, DestinationError
+        from .converter import get_audio_converter, ConversionError
+        from .watcher import BounceWatcher
+
         logger.info("Starting Bounce Watcher")
         logger.debug(f"Configuration loaded from: {config.config_path}")
 
@@ -98,6 +102,8 @@ def main():
         audio_folder_name = source_config.get("audio_files_folder", "Audio Files")
         mix_prefix = source_config.get("mix_file_prefix", "mix")
         source_mode = source_config.get("mode", "specific_folders")
+        scan_on_startup = source_config.get("scan_on_startup", False)
+        use_polling = source_config.get("use_polling", False)
 
         conv_config = config.config.get("conversion", {})
         stability_interval = conv_config.get("stability_check_interval", 2)
@@ -113,7 +119,9 @@ def main():
             source_manager=source_manager,
             source_mode=source_mode,
             stability_interval=stability_interval,
-            stability_checks=stability_checks
+            stability_checks=stability_checks,
+            scan_on_startup=scan_on_startup,
+            use_polling=use_polling
         )
 
         # Send startup notification
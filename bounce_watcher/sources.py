@@ -5,11 +5,14 @@ Handles detection and management of source folders including external drive
 discovery with smart filtering.
 """
 
+import os
 import subprocess
 import plistlib
 import re
+import time
+from collections import deque
 from pathlib import Path
-from typing import List, Set, Dict, Any
+from typing import Iterator, List, Set, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -47,6 +50,19 @@ class SourceManager:
         r"^\.fseventsd",
     ]
 
+    # EXCLUDE_PATTERNS compiled once into a single case-insensitive pattern
+    _EXCLUDE_RE = re.compile("|".join(f"(?:{p})" for p in EXCLUDE_PATTERNS), re.IGNORECASE)
+
+    # Directory names never descended into when searching for audio folders
+    # (hidden directories are skipped as well)
+    SKIP_DIR_NAMES = frozenset({"Backups.backupdb", "Time Machine Backups"})
+
+    # How many levels below a root to search for audio folders
+    MAX_SCAN_DEPTH = 8
+
+    # Seconds a get_watch_roots() result is reused before scanning again
+    ROOTS_CACHE_TTL = 30.0
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize source manager.
@@ -58,24 +74,44 @@ class SourceManager:
         self.mode = config.get("mode", "specific_folders")
         self.folders = config.get("folders", [])
         self.audio_files_folder = config.get("audio_files_folder", "Audio Files")
+        # (monotonic time scanned, watch roots) from the last get_watch_roots()
+        self._roots_cache: Optional[Tuple[float, List[str]]] = None
+        # /Volumes mtime and the drives found when it had that mtime
+        self._volumes_mtime: Optional[int] = None
+        self._cached_drives: List[DriveInfo] = []
 
     def get_watch_roots(self) -> List[str]:
         """
         Get list of root directories to watch.
 
+        Results are reused for ROOTS_CACHE_TTL seconds; call refresh() to
+        force a rescan sooner.
+
         Returns:
             List of absolute paths to watch
 
         Raises:
             RuntimeError: If no valid watch roots found
         """
+        cached = self._roots_cache
+        if cached is not None and time.monotonic() - cached[0] < self.ROOTS_CACHE_TTL:
+            return list(cached[1])
+
         if self.mode == "specific_folders":
-            return self._get_specific_folders()
+            roots = self._get_specific_folders()
         elif self.mode == "all_external_drives":
-            return self._get_external_drives()
+            roots = self._get_external_drives()
         else:
             raise ValueError(f"Invalid source mode: {self.mode}")
 
+        self._roots_cache = (time.monotonic(), roots)
+        return list(roots)
+
+    def refresh(self) -> None:
+        """Forget cached watch roots and drives, e.g. after a drive was mounted or unmounted."""
+        self._roots_cache = None
+        self._volumes_mtime = None
+
     def _get_specific_folders(self) -> List[str]:
         """
         Get specific folders from configuration.
@@ -124,74 +160,137 @@ class SourceManager:
         """
         Detect all mounted external drives using diskutil.
 
+        The previous result is reused while the /Volumes mtime is unchanged,
+        since mounting or unmounting a volume updates it.
+
         Returns:
             List of DriveInfo objects for external drives
         """
-        drives = []
         volumes_path = Path("/Volumes")
 
-        if not volumes_path.exists():
+        try:
+            volumes_mtime = os.stat(volumes_path).st_mtime_ns
+        except FileNotFoundError:
             print("Warning: /Volumes directory not found")
             return []
 
-        # Iterate through all mounted volumes
-        try:
-            for volume_path in volumes_path.iterdir():
-                if not volume_path.is_dir():
-                    continue
+        if volumes_mtime == self._volumes_mtime:
+            return list(self._cached_drives)
 
-                # Skip hidden volumes
-                if volume_path.name.startswith('.'):
-                    continue
+        # All mounted volumes, skipping hidden ones
+        try:
+            with os.scandir(volumes_path) as entries:
+                mount_points = [
+                    entry.path for entry in entries
+                    if not entry.name.startswith('.') and entry.is_dir()
+                ]
+        except OSError as e:
+            print(f"Warning: Error scanning /Volumes: {e}")
+            return []
 
-                mount_point = str(volume_path)
-
-                # Get volume info using diskutil
-                try:
-                    result = subprocess.run(
-                        ["diskutil", "info", "-plist", mount_point],
-                        capture_output=True,
-                        check=True
-                    )
-                    volume_info = plistlib.loads(result.stdout)
-                except subprocess.CalledProcessError:
-                    # Volume might have been unmounted or is inaccessible
-                    continue
-                except Exception as e:
-                    print(f"Warning: Error getting info for {mount_point}: {e}")
-                    continue
+        # Metadata for every external volume from one disk listing; fall
+        # back to asking diskutil per volume if that fails
+        external_volumes = self._query_external_volumes()
+        if external_volumes is None:
+            found = [self.inspect_mount_point(mount_point) for mount_point in mount_points]
+        else:
+            found = [external_volumes.get(mount_point) for mount_point in mount_points]
+        drives = [drive for drive in found if drive is not None]
 
-                # Check if this is an external drive
-                # Use RemovableMediaOrExternalDevice as primary check, fall back to Internal flag
-                is_external = (
-                    volume_info.get("RemovableMediaOrExternalDevice", False) or
-                    volume_info.get("Internal", True) == False
-                )
+        self._volumes_mtime = volumes_mtime
+        self._cached_drives = list(drives)
+        return drives
 
-                if not is_external:
-                    continue
+    def _query_external_volumes(self) -> Optional[Dict[str, DriveInfo]]:
+        """
+        Get drive information for all mounted external volumes at once.
 
-                # Get volume details
-                device = volume_info.get("DeviceIdentifier", "")
-                volume_name = volume_info.get("VolumeName", volume_path.name)
-                filesystem = volume_info.get("FilesystemType", "").lower()
-                size_bytes = volume_info.get("TotalSize", 0)
+        Uses one `diskutil list -plist external` call, which lists only
+        external disks, instead of one diskutil process per volume.
 
-                drive_info = DriveInfo(
+        Returns:
+            Mapping of mount point to DriveInfo for external volumes, or
+            None if the disk list could not be read
+        """
+        try:
+            result = subprocess.run(
+                ["diskutil", "list", "-plist", "external"],
+                capture_output=True,
+                check=True,
+                timeout=30
+            )
+            disks = plistlib.loads(result.stdout).get("AllDisksAndPartitions", [])
+        except (OSError, subprocess.SubprocessError, plistlib.InvalidFileException,
+                AttributeError, ValueError):
+            return None
+
+        volumes = {}
+        for disk in disks:
+            # A disk formatted without a partition map is itself the volume;
+            # APFS volumes live on the synthesized container disk
+            entries = [(disk, disk.get("Content", ""))]
+            entries += [(part, part.get("Content", "")) for part in disk.get("Partitions", [])]
+            entries += [(volume, "apfs") for volume in disk.get("APFSVolumes", [])]
+
+            for entry, content in entries:
+                mount_point = entry.get("MountPoint")
+                if not mount_point:
+                    continue
+                volumes[mount_point] = DriveInfo(
                     mount_point=mount_point,
-                    device=device,
-                    filesystem=filesystem,
-                    volume_name=volume_name,
-                    size_bytes=size_bytes,
-                    is_external=is_external
+                    device=entry.get("DeviceIdentifier", ""),
+                    filesystem=_normalize_filesystem(content),
+                    volume_name=entry.get("VolumeName", os.path.basename(mount_point)),
+                    size_bytes=entry.get("Size", 0),
+                    is_external=True
                 )
 
-                drives.append(drive_info)
+        return volumes
 
-        except Exception as e:
-            print(f"Warning: Error scanning /Volumes: {e}")
+    def inspect_mount_point(self, mount_point: str) -> Optional[DriveInfo]:
+        """
+        Get drive information for a single mounted volume using diskutil.
 
-        return drives
+        Args:
+            mount_point: Volume mount point (e.g. /Volumes/Great 8)
+
+        Returns:
+            DriveInfo if the volume is an external drive, None otherwise
+        """
+        # Get volume info using diskutil
+        try:
+            result = subprocess.run(
+                ["diskutil", "info", "-plist", mount_point],
+                capture_output=True,
+                check=True
+            )
+            volume_info = plistlib.loads(result.stdout)
+        except subprocess.CalledProcessError:
+            # Volume might have been unmounted or is inaccessible
+            return None
+        except Exception as e:
+            print(f"Warning: Error getting info for {mount_point}: {e}")
+            return None
+
+        # Check if this is an external drive
+        # Use RemovableMediaOrExternalDevice as primary check, fall back to Internal flag
+        is_external = (
+            volume_info.get("RemovableMediaOrExternalDevice", False) or
+            volume_info.get("Internal", True) == False
+        )
+
+        if not is_external:
+            return None
+
+        # Get volume details
+        return DriveInfo(
+            mount_point=mount_point,
+            device=volume_info.get("DeviceIdentifier", ""),
+            filesystem=volume_info.get("FilesystemType", "").lower(),
+            volume_name=volume_info.get("VolumeName", Path(mount_point).name),
+            size_bytes=volume_info.get("TotalSize", 0),
+            is_external=is_external
+        )
 
     def _apply_smart_filtering(self, drives: List[DriveInfo]) -> List[DriveInfo]:
         """
@@ -212,36 +311,45 @@ class SourceManager:
         filtered = []
 
         for drive in drives:
-            # Check filesystem
-            if drive.filesystem not in self.ALLOWED_FILESYSTEMS:
-                print(f"Excluding {drive.mount_point}: unsupported filesystem ({drive.filesystem})")
-                continue
-
-            # Check size
-            if drive.size_bytes < self.MIN_DRIVE_SIZE:
-                size_mb = drive.size_bytes / (1024 * 1024)
-                print(f"Excluding {drive.mount_point}: too small ({size_mb:.1f} MB)")
-                continue
-
-            # Check exclude patterns
-            excluded = False
-            for pattern in self.EXCLUDE_PATTERNS:
-                if re.search(pattern, drive.mount_point, re.IGNORECASE):
-                    print(f"Excluding {drive.mount_point}: matches exclusion pattern '{pattern}'")
-                    excluded = True
-                    break
-                if re.search(pattern, drive.volume_name, re.IGNORECASE):
-                    print(f"Excluding {drive.mount_point}: volume name matches exclusion pattern '{pattern}'")
-                    excluded = True
-                    break
-
-            if excluded:
+            reason = self._exclusion_reason(drive)
+            if reason is not None:
+                print(f"Excluding {drive.mount_point}: {reason}")
                 continue
 
             filtered.append(drive)
 
         return filtered
 
+    def _exclusion_reason(self, drive: DriveInfo) -> Optional[str]:
+        """
+        Check a drive against the smart filtering rules, cheapest first.
+
+        Args:
+            drive: Drive to check
+
+        Returns:
+            Why the drive is excluded, or None if it passes
+        """
+        # Check filesystem
+        if drive.filesystem not in self.ALLOWED_FILESYSTEMS:
+            return f"unsupported filesystem ({drive.filesystem})"
+
+        # Check size
+        if drive.size_bytes < self.MIN_DRIVE_SIZE:
+            size_mb = drive.size_bytes / (1024 * 1024)
+            return f"too small ({size_mb:.1f} MB)"
+
+        # Check exclude patterns (the short volume name first; it is what
+        # usually identifies a Time Machine drive)
+        match = self._EXCLUDE_RE.search(drive.volume_name)
+        if match:
+            return f"volume name matches exclusion pattern ('{match.group(0)}')"
+        match = self._EXCLUDE_RE.search(drive.mount_point)
+        if match:
+            return f"matches exclusion pattern ('{match.group(0)}')"
+
+        return None
+
     def find_audio_folders(self, root: str) -> List[str]:
         """
         Find all audio files folders under a root directory.
@@ -252,18 +360,47 @@ class SourceManager:
         Returns:
             List of paths to audio files folders
         """
-        audio_folders = []
-        root_path = Path(root)
-
-        if not root_path.exists():
+        if not os.path.isdir(root):
             return []
 
-        # Search recursively for folders matching the audio files folder name
-        for audio_folder in root_path.rglob(self.audio_files_folder):
-            if audio_folder.is_dir():
-                audio_folders.append(str(audio_folder.absolute()))
+        return list(self._walk_for_audio_folders(os.path.abspath(root)))
+
+    def _walk_for_audio_folders(self, root: str) -> Iterator[str]:
+        """
+        Walk a directory tree breadth-first, yielding audio files folders.
+
+        Uses os.scandir so directory checks come from the cached entry
+        type. Hidden directories, SKIP_DIR_NAMES, directories matching
+        EXCLUDE_PATTERNS and symlinks are not descended into, nor are the
+        audio folders themselves; the walk stops MAX_SCAN_DEPTH levels down.
 
-        return audio_folders
+        Args:
+            root: Absolute path of the directory to search
+
+        Yields:
+            Paths of folders named like the audio files folder
+        """
+        pending = deque([(root, 0)])
+        while pending:
+            directory, depth = pending.popleft()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name == self.audio_files_folder:
+                            if entry.is_dir():
+                                yield entry.path
+                            continue
+
+                        if depth >= self.MAX_SCAN_DEPTH or name.startswith('.'):
+                            continue
+                        if name in self.SKIP_DIR_NAMES or self._EXCLUDE_RE.search(name):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, depth + 1))
+            except OSError:
+                # Unreadable or vanished directory; skip it
+                continue
 
     def get_all_audio_folders(self) -> List[str]:
         """
@@ -286,6 +423,25 @@ class SourceManager:
         return f"SourceManager(mode={self.mode}, folders={len(self.folders)})"
 
 
+def _normalize_filesystem(name: str) -> str:
+    """
+    Map a `diskutil list` content type to diskutil's FilesystemType.
+
+    Args:
+        name: Partition content type as reported by diskutil (e.g. "Apple_HFS")
+
+    Returns:
+        Lowercase diskutil-style type (e.g. "apfs", "hfs"), as used by
+        SourceManager.ALLOWED_FILESYSTEMS
+    """
+    name = name.lower()
+    if "apfs" in name:
+        return "apfs"
+    if "hfs" in name:
+        return "hfs"
+    return name
+
+
 def get_source_manager(config: Dict[str, Any]) -> SourceManager:
     """
     Create and return a source manager from configuration.
@@ -4,72 +4,255 @@ Utility functions for Bounce Watcher.
 Handles logging, notifications, and other common utilities.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import os
+import queue
 import subprocess
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, Union
 
 
-def setup_logging(log_file: Optional[str] = None, level: str = "INFO") -> logging.Logger:
+class _BufferedFileHandler(logging.handlers.MemoryHandler):
+    """
+    Buffer log records in memory and write them to a file handler in batches.
+
+    The buffer is written out when it fills, on any ERROR or CRITICAL
+    record, and at least every FLUSH_INTERVAL seconds so the log file
+    never lags far behind.
+    """
+
+    FLUSH_INTERVAL = 5.0
+
+    def __init__(self, target: logging.Handler, capacity: int = 512):
+        """
+        Initialize buffered handler.
+
+        Args:
+            target: Handler that writes the records (e.g. a FileHandler)
+            capacity: Number of records to buffer before writing
+        """
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="log-flush",
+            daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self):
+        """Write out buffered records every FLUSH_INTERVAL seconds until closed."""
+        while not self._stop_flushing.wait(self.FLUSH_INTERVAL):
+            self.flush()
+
+    def close(self):
+        """Write out remaining records and close the target handler."""
+        self._stop_flushing.set()
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
+# Background thread that writes queued log records (see setup_logging)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# (log file, numeric level) the running listener was set up with
+_logging_config: Optional[Tuple[Optional[str], int]] = None
+
+# Shared by the console and file handlers
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+
+def setup_logging(log_file: Optional[str] = None, level: Union[str, int] = "INFO") -> logging.Logger:
     """
     Set up logging configuration.
 
+    Loggers only put records on a queue; a background listener thread
+    formats them and does the console and file I/O. Calling this again
+    with the same settings keeps the existing setup.
+
     Args:
         log_file: Path to log file. If None, logs to console only.
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: Logging level name (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            or numeric level (e.g. logging.DEBUG)
 
     Returns:
         Configured logger instance
     """
+    global _log_listener, _logging_config
+
     # Create logger
     logger = logging.getLogger("bounce_watcher")
-    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    if isinstance(level, int):
+        numeric_level = level
+    else:
+        numeric_level = getattr(logging, level.upper(), logging.INFO)
 
-    # Remove existing handlers
-    logger.handlers.clear()
+    if _log_listener is not None and _logging_config == (log_file, numeric_level):
+        return logger
 
-    # Create formatters
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    logger.setLevel(numeric_level)
+
+    # Remove existing handlers (closing them writes out any buffered records)
+    stop_logging()
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(_FORMATTER)
+    handlers = [console_handler]
 
     # File handler (if log file specified)
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Records are buffered and written in batches rather than one
+        # write() per record
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_FORMATTER)
+        handlers.append(_BufferedFileHandler(file_handler))
+
+    # Hand records to the listener thread instead of writing inline
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue,
+        *handlers,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _logging_config = (log_file, numeric_level)
 
     return logger
 
 
+def stop_logging() -> None:
+    """
+    Stop the log listener started by setup_logging.
+
+    Writes out every queued record and closes the console and file
+    handlers. Also runs at interpreter exit.
+    """
+    global _log_listener
+    listener = _log_listener
+    if listener is None:
+        return
+    _log_listener = None
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(stop_logging)
+
+
+# osascript command lines for send_notification; the texts follow as argv
+_NOTIFY_SCRIPT = (
+    "osascript",
+    "-e", "on run argv",
+    "-e", "display notification (item 1 of argv) with title (item 2 of argv)",
+    "-e", "end run",
+)
+_NOTIFY_SUBTITLE_SCRIPT = (
+    "osascript",
+    "-e", "on run argv",
+    "-e", "display notification (item 1 of argv) with title (item 2 of argv) subtitle (item 3 of argv)",
+    "-e", "end run",
+)
+
+
+# Notifications waiting for the notifier thread; None stops the thread
+_notify_queue: "queue.Queue[Optional[Tuple[str, str, Optional[str]]]]" = queue.Queue(maxsize=64)
+_notify_thread: Optional[threading.Thread] = None
+_notify_lock = threading.Lock()
+
+
 def send_notification(title: str, message: str, subtitle: Optional[str] = None) -> None:
     """
     Send macOS notification using osascript.
 
+    The notification is shown by a background thread, so this returns
+    without waiting for osascript. If too many are pending it is dropped.
+
+    Args:
+        title: Notification title
+        message: Notification message
+        subtitle: Optional subtitle
+    """
+    global _notify_thread
+    with _notify_lock:
+        if _notify_thread is None:
+            _notify_thread = threading.Thread(
+                target=_notification_worker,
+                name="notify",
+                daemon=True
+            )
+            _notify_thread.start()
+            atexit.register(_flush_notifications)
+
+    try:
+        _notify_queue.put_nowait((title, message, subtitle))
+    except queue.Full:
+        pass
+
+
+def _notification_worker() -> None:
+    """Show queued notifications one at a time until stopped."""
+    while True:
+        item = _notify_queue.get()
+        if item is None:
+            break
+        _show_notification(*item)
+
+
+def _flush_notifications(timeout: float = 10.0) -> None:
+    """
+    Let the notifier thread show what is still queued (run at exit).
+
+    Args:
+        timeout: Maximum seconds to wait
+    """
+    try:
+        _notify_queue.put(None, timeout=timeout)
+    except queue.Full:
+        return
+    if _notify_thread is not None:
+        _notify_thread.join(timeout)
+
+
+def _show_notification(title: str, message: str, subtitle: Optional[str]) -> None:
+    """
+    Show a notification with osascript (see send_notification).
+
     Args:
         title: Notification title
         message: Notification message
         subtitle: Optional subtitle
     """
     try:
-        # Build AppleScript command
-        script = f'display notification "{message}" with title "{title}"'
+        # Texts are passed as arguments, never spliced into the script, so
+        # quotes in file names can't break (or inject into) the AppleScript
         if subtitle:
-            script = f'display notification "{message}" with title "{title}" subtitle "{subtitle}"'
+            args = [*_NOTIFY_SUBTITLE_SCRIPT, message, title, subtitle]
+        else:
+            args = [*_NOTIFY_SCRIPT, message, title]
 
         subprocess.run(
-            ["osascript", "-e", script],
+            args,
             capture_output=True,
             timeout=5
         )
@@ -78,6 +261,10 @@ def send_notification(title: str, message: str, subtitle: Optional[str] = None)
         print(f"Warning: Failed to send notification: {e}")
 
 
+# Units for format_file_size, each 1024 times the previous one
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -88,11 +275,12 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string (e.g., "1.5 MB", "3.2 GB")
     """
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+
+    # Each unit is 2**10 times the last, so the bit length picks it directly
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
 
 
 def format_duration(seconds: float) -> str:
@@ -119,6 +307,10 @@ def format_duration(seconds: float) -> str:
     return f"{hours}h {remaining_minutes}m"
 
 
+# Invalid filename characters mapped to underscores (see sanitize_filename)
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '/\\:*?"<>|'})
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename by removing invalid characters.
@@ -130,11 +322,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Replace invalid characters with underscores
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    sanitized = filename
-    for char in invalid_chars:
-        sanitized = sanitized.replace(char, '_')
-    return sanitized
+    return filename.translate(_SANITIZE_TABLE)
 
 
 def get_session_name(file_path: str) -> Optional[str]:
@@ -149,18 +337,45 @@ def get_session_name(file_path: str) -> Optional[str]:
     Returns:
         Session name or None if cannot be determined
     """
-    path = Path(file_path)
+    # Every file in a folder belongs to the same session, so look it up
+    # (and cache it) per directory
+    return _session_name_for_dir(os.path.dirname(file_path))
 
-    # Walk up the path to find "Audio Files" folder
-    for parent in path.parents:
+
+@functools.lru_cache(maxsize=1024)
+def _session_name_for_dir(directory: str) -> Optional[str]:
+    """
+    Find the session name for files in a directory (see get_session_name).
+
+    Args:
+        directory: Directory containing the audio file
+
+    Returns:
+        Session name or None if cannot be determined
+    """
+    # The innermost ".../Session/Audio Files/..." in the path
+    path = directory + os.sep
+    end = path.rfind(f"{os.sep}Audio Files{os.sep}")
+    if end >= 0:
+        start = path.rfind(os.sep, 0, end)
+        return path[start + 1:end]
+
+    # Not an absolute-style path (e.g. relative "Audio Files/..."); walk up
+    # the path to find "Audio Files" folder
+    dir_path = Path(directory)
+    for parent in (dir_path, *dir_path.parents):
         if parent.name == "Audio Files":
             # Session name is the parent of "Audio Files"
-            session_parent = parent.parent
-            return session_parent.name
+            return parent.parent.name
 
     return None
 
 
+# Extensions (lowercase, without dot) of supported audio files
+AUDIO_EXTENSIONS = frozenset({"wav", "aiff", "aif"})
+
+
+@functools.lru_cache(maxsize=4096)
 def is_mix_file(filename: str, prefix: str = "mix") -> bool:
     """
     Check if filename is a mix file.
@@ -175,6 +390,7 @@ def is_mix_file(filename: str, prefix: str = "mix") -> bool:
     return filename.lower().startswith(prefix.lower())
 
 
+@functools.lru_cache(maxsize=4096)
 def get_file_extension(filename: str) -> str:
     """
     Get file extension (lowercase, without dot).
@@ -185,10 +401,14 @@ def get_file_extension(filename: str) -> str:
     Returns:
         Lowercase extension without dot (e.g., "wav", "aiff")
     """
-    path = Path(filename)
-    return path.suffix.lstrip('.').lower()
+    # Same rules as Path.suffix: a leading dot (".wav") is not an extension
+    dot = filename.rfind('.')
+    if dot <= 0:
+        return ''
+    return filename[dot + 1:].lower()
 
 
+@functools.lru_cache(maxsize=4096)
 def is_audio_file(filename: str) -> bool:
     """
     Check if file is a supported audio file.
@@ -199,6 +419,4 @@ def is_audio_file(filename: str) -> bool:
     Returns:
         True if file has supported audio extension
     """
-    supported_extensions = ['wav', 'aiff', 'aif']
-    ext = get_file_extension(filename)
-    return ext in supported_extensions
+    return get_file_extension(filename) in AUDIO_EXTENSIONS
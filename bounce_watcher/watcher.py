@@ -4,17 +4,20 @@ File system watching for Bounce Watcher.
 Monitors Pro Tools session folders for new mix files and triggers conversion.
 """
 
-import time
+import heapq
+import os
+import sys
 import threading
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
 from .utils import (
     get_session_name,
-    is_mix_file,
     is_audio_file,
     send_notification
 )
@@ -45,10 +48,12 @@ class FileStabilityMonitor:
             checks_required: Number of consecutive checks with same size required
         """
         self.file_path = Path(file_path)
+        # Interned once - used as the watch key and for stat()
+        self.path_key = sys.intern(str(file_path))
         self.callback = callback
         self.check_interval = check_interval
         self.checks_required = checks_required
-        self.size_history = []
+        self.last_size: Optional[int] = None
         self.check_count = 0
         self.logger = logging.getLogger("bounce_watcher.stability")
 
@@ -60,19 +65,19 @@ class FileStabilityMonitor:
             True if file is stable, False if still being written
         """
         try:
-            if not self.file_path.exists():
+            try:
+                current_size = os.stat(self.path_key).st_size
+            except FileNotFoundError:
                 self.logger.warning(f"File disappeared: {self.file_path}")
                 return False
 
-            current_size = self.file_path.stat().st_size
-
             # First check
-            if len(self.size_history) == 0:
-                self.size_history.append(current_size)
+            if self.last_size is None:
+                self.last_size = current_size
                 return False
 
             # Compare with last check
-            if current_size == self.size_history[-1]:
+            if current_size == self.last_size:
                 self.check_count += 1
                 if self.check_count >= self.checks_required:
                     self.logger.info(f"File stable: {self.file_path.name} ({current_size:,} bytes)")
@@ -80,7 +85,7 @@ class FileStabilityMonitor:
             else:
                 # Size changed, reset counter
                 self.check_count = 0
-                self.size_history.append(current_size)
+                self.last_size = current_size
                 self.logger.debug(f"File still growing: {self.file_path.name} ({current_size:,} bytes)")
 
             return False
@@ -119,11 +124,20 @@ class MixFileHandler(FileSystemEventHandler):
         """
         super().__init__()
         self.audio_folder_name = audio_folder_name
+        # "/Audio Files/" - matched against raw event paths
+        self._audio_folder_marker = f"{os.sep}{audio_folder_name}{os.sep}"
         self.mix_prefix = mix_prefix
+        # Fixed for the handler's lifetime, so lowercased once here
+        self._mix_prefix_lower = mix_prefix.lower()
         self.on_stable_file = on_stable_file
         self.stability_interval = stability_interval
         self.stability_checks = stability_checks
         self.files_being_watched: Dict[str, FileStabilityMonitor] = {}
+        # Min-heap of (monotonic time of next check, path key)
+        self._schedule: List[Tuple[float, str]] = []
+        # Guards files_being_watched and _schedule, which the observer thread
+        # adds to and the stability thread removes from
+        self._lock = threading.Lock()
         self.check_trigger = check_trigger
         self.logger = logging.getLogger("bounce_watcher.handler")
 
@@ -137,55 +151,79 @@ class MixFileHandler(FileSystemEventHandler):
         if event.is_directory:
             return
 
-        file_path = Path(event.src_path)
-
-        # Check if this is in an audio files folder
-        if self.audio_folder_name not in file_path.parts:
+        # Check if this is in an audio files folder (on the raw path string:
+        # most events on a watched drive are not, so don't build a Path yet)
+        if self._audio_folder_marker not in event.src_path:
             return
 
+        file_name = os.path.basename(event.src_path)
+
         # Check if this is an audio file
-        if not is_audio_file(file_path.name):
+        if not is_audio_file(file_name):
             return
 
-        # Check if filename starts with mix prefix
-        if not is_mix_file(file_path.name, self.mix_prefix):
+        # Check if filename starts with mix prefix (case-insensitive)
+        if not file_name.lower().startswith(self._mix_prefix_lower):
             return
 
-        self.logger.info(f"New mix file detected: {file_path.name}")
+        self.logger.info(f"New mix file detected: {file_name}")
 
         # Start monitoring this file for stability
-        file_path_str = str(file_path)
-        if file_path_str not in self.files_being_watched:
+        with self._lock:
+            if event.src_path in self.files_being_watched:
+                return
             monitor = FileStabilityMonitor(
-                file_path_str,
+                event.src_path,
                 self.on_stable_file,
                 self.stability_interval,
                 self.stability_checks
             )
-            self.files_being_watched[file_path_str] = monitor
-            self.logger.info(f"Monitoring file for stability: {file_path.name}")
+            self.files_being_watched[monitor.path_key] = monitor
+            # First check is due right away (it records the starting size)
+            heapq.heappush(self._schedule, (time.monotonic(), monitor.path_key))
 
-            # Wake up the stability checker immediately
-            if self.check_trigger:
-                self.check_trigger.set()
+        self.logger.info(f"Monitoring file for stability: {file_name}")
 
-    def check_all_files(self):
-        """
-        Check stability of all monitored files.
+        # Wake up the stability checker immediately
+        if self.check_trigger:
+            self.check_trigger.set()
 
-        Should be called periodically by the stability check loop.
+    def check_due_files(self) -> Optional[float]:
         """
-        files_to_remove = []
+        Check stability of the monitored files whose next check is due.
 
-        for file_path_str, monitor in list(self.files_being_watched.items()):
+        Should be called by the stability check loop when the previously
+        returned delay has passed, or when a new file is being monitored.
+
+        Returns:
+            Seconds until the next check is due, or None if no files are monitored
+        """
+        # Take every file that is due now; files rescheduled below or added
+        # meanwhile wait for the next call. The stat calls run without the lock.
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                _, path_key = heapq.heappop(self._schedule)
+                due.append(self.files_being_watched[path_key])
+
+        for monitor in due:
             if monitor.check_stability():
-                # File is stable, process it
+                # File is stable, process it and drop it from the watch list
+                with self._lock:
+                    del self.files_being_watched[monitor.path_key]
                 monitor.callback(monitor.file_path)
-                files_to_remove.append(file_path_str)
+            else:
+                with self._lock:
+                    heapq.heappush(
+                        self._schedule,
+                        (time.monotonic() + monitor.check_interval, monitor.path_key)
+                    )
 
-        # Remove processed files from watch list
-        for file_path_str in files_to_remove:
-            del self.files_being_watched[file_path_str]
+        with self._lock:
+            if not self._schedule:
+                return None
+            return max(0.0, self._schedule[0][0] - time.monotonic())
 
 
 class BounceWatcher:
@@ -195,6 +233,9 @@ class BounceWatcher:
     Supports dynamic drive monitoring for hot-plug detection.
     """
 
+    # Seconds between scans when polling (use_polling)
+    POLLING_INTERVAL = 5
+
     def __init__(
         self,
         watch_roots: list,
@@ -205,7 +246,9 @@ class BounceWatcher:
         source_manager=None,
         source_mode: str = "specific_folders",
         stability_interval: int = 2,
-        stability_checks: int = 3
+        stability_checks: int = 3,
+        scan_on_startup: bool = False,
+        use_polling: bool = False
     ):
         """
         Initialize bounce watcher.
@@ -220,6 +263,9 @@ class BounceWatcher:
             source_mode: Source mode ("specific_folders" or "all_external_drives")
             stability_interval: Seconds between stability checks
             stability_checks: Number of checks required for stability
+            scan_on_startup: Log existing audio folders when a root starts being watched
+            use_polling: Poll watch roots for changes instead of using native
+                file system events (for network drives that don't report them)
         """
         self.watch_roots = watch_roots
         self.audio_folder_name = audio_folder_name
@@ -230,6 +276,7 @@ class BounceWatcher:
         self.source_mode = source_mode
         self.stability_interval = stability_interval
         self.stability_checks = stability_checks
+        self.scan_on_startup = scan_on_startup
         self.logger = logging.getLogger("bounce_watcher")
 
         # Track active watch handles for each drive (for dynamic removal)
@@ -238,6 +285,9 @@ class BounceWatcher:
         # Create trigger event for efficient stability checking
         self.check_trigger = threading.Event()
 
+        # Set by stop(); run() blocks on it
+        self._stop_event = threading.Event()
+
         # Create event handler
         self.event_handler = MixFileHandler(
             audio_folder_name,
@@ -248,13 +298,35 @@ class BounceWatcher:
             check_trigger=self.check_trigger
         )
 
-        # Create observer
-        self.observer = Observer()
+        # Stable files are converted on a pool so one long conversion
+        # doesn't hold up the others (or the stability checks)
+        self.conversion_pool = ThreadPoolExecutor(
+            max_workers=audio_converter.parallel_jobs,
+            thread_name_prefix="convert"
+        )
+
+        # Create observer. One observer serves every watch root: roots added
+        # later are scheduled on it rather than getting observers of their own.
+        # The native one is FSEvents on macOS (inotify on Linux).
+        if use_polling:
+            from watchdog.observers.polling import PollingObserver
+            self.observer = PollingObserver(timeout=self.POLLING_INTERVAL)
+        else:
+            self.observer = Observer()
         self.stability_thread = None
         self.drive_monitor = None
         self.running = False
 
     def process_stable_file(self, file_path: Path):
+        """
+        Queue a stable file for conversion on the conversion pool.
+
+        Args:
+            file_path: Path to stable file to process
+        """
+        self.conversion_pool.submit(self._convert_stable_file, file_path)
+
+    def _convert_stable_file(self, file_path: Path):
         """
         Process a stable file (convert it).
 
@@ -302,7 +374,7 @@ class BounceWatcher:
             )
 
         except Exception as e:
-            self.logger.error(f"Error processing {file_path}: {e}", exc_info=True)
+            self.logger.exception("Error processing %s: %s", file_path, e)
             send_notification(
                 "Bounce Watcher Error",
                 f"Failed to convert {file_path.name}: {str(e)}"
@@ -313,25 +385,23 @@ class BounceWatcher:
         Background thread that efficiently checks file stability.
 
         Uses event-driven waiting and adaptive polling to minimize CPU usage.
-        Only actively checks when files are being monitored.
+        Only actively checks when files are being monitored, and then sleeps
+        until the next file's check is due.
         """
         idle_interval = 30  # Check every 30 seconds when idle
         consecutive_idle_checks = 0
         max_idle_checks = 10  # After 10 idle checks (5 minutes), slow down further
 
         while self.running:
-            # Check if there are files to monitor
-            num_files = len(self.event_handler.files_being_watched)
+            # Check the files that are due; None means nothing is monitored
+            next_check = self.event_handler.check_due_files()
 
-            if num_files > 0:
-                # Active mode: Check files at configured interval
-                # Use Event.wait() with timeout for efficient CPU usage
-                self.check_trigger.wait(timeout=self.stability_interval)
+            if next_check is not None:
+                # Active mode: sleep until the next check is due
+                # Use Event.wait() so a new file wakes us up early
+                self.check_trigger.wait(timeout=next_check)
                 self.check_trigger.clear()
 
-                # Check all files for stability
-                self.event_handler.check_all_files()
-
                 # Reset idle counter
                 consecutive_idle_checks = 0
 
@@ -376,12 +446,10 @@ class BounceWatcher:
             # Schedule watching for this drive
             watch_handle = self.observer.schedule(self.event_handler, str(root), recursive=True)
             self.active_watches[mount_point] = watch_handle
+            self.logger.info(f"Now watching: {mount_point}")
 
             # Log existing audio folders
-            audio_folders = self._find_audio_folders(root)
-            self.logger.info(f"Now watching: {mount_point}")
-            if audio_folders:
-                self.logger.info(f"  Found {len(audio_folders)} Audio Files folders")
+            self._log_existing_audio_folders([root])
 
         except Exception as e:
             self.logger.error(f"Failed to add watch for {mount_point}: {e}")
@@ -427,11 +495,6 @@ class BounceWatcher:
                 self.active_watches[root_path] = watch_handle
                 watched_paths.append(root)
                 self.logger.info(f"Watching: {root}")
-
-                # Log existing audio folders
-                audio_folders = self._find_audio_folders(root)
-                if audio_folders:
-                    self.logger.info(f"Found {len(audio_folders)} existing Audio Files folders")
             else:
                 self.logger.warning(f"Watch root does not exist: {root_path}")
 
@@ -442,6 +505,9 @@ class BounceWatcher:
         self.observer.start()
         self.logger.info("File system observer started")
 
+        # Log existing audio folders (observer is already collecting events)
+        self._log_existing_audio_folders(watched_paths)
+
         # Start stability check loop
         self.running = True
         self.stability_thread = threading.Thread(target=self._stability_check_loop, daemon=True)
@@ -467,6 +533,7 @@ class BounceWatcher:
         """Stop watching for files."""
         self.logger.info("Stopping bounce watcher...")
         self.running = False
+        self._stop_event.set()
 
         # Stop drive monitoring if active
         if self.drive_monitor:
@@ -474,22 +541,50 @@ class BounceWatcher:
 
         self.observer.stop()
         self.observer.join()
+
+        # Let conversions already running finish, drop queued ones
+        self.conversion_pool.shutdown(wait=True, cancel_futures=True)
         self.logger.info("Bounce watcher stopped")
 
     def run(self):
         """
         Run the watcher (blocking).
 
-        Starts watching and blocks until interrupted with Ctrl+C.
+        Starts watching and blocks until interrupted with Ctrl+C (or until
+        stop() is called from another thread).
         """
         self.start()
 
         try:
-            while True:
-                time.sleep(1)
+            # No timeout: the thread sleeps until stop() or a signal wakes it
+            self._stop_event.wait()
         except KeyboardInterrupt:
             self.stop()
 
+    def _log_existing_audio_folders(self, roots: list):
+        """
+        Log existing audio files folders under the given roots.
+
+        The recursive watch already covers new folders, so this is purely
+        informational. Skipped unless scan_on_startup is enabled; otherwise
+        runs in a background thread so watching is not delayed.
+
+        Args:
+            roots: Root paths that were just scheduled for watching
+        """
+        if not self.scan_on_startup:
+            for root in roots:
+                self.logger.info(f"Recursive watch active on {root}; startup enumeration skipped")
+            return
+
+        def scan():
+            for root in roots:
+                audio_folders = self._find_audio_folders(root)
+                if audio_folders:
+                    self.logger.info(f"Found {len(audio_folders)} existing Audio Files folders in {root}")
+
+        threading.Thread(target=scan, daemon=True).start()
+
     def _find_audio_folders(self, root_path: Path) -> list:
         """
         Find all audio files folders under root path.
@@ -500,18 +595,47 @@ class BounceWatcher:
         Returns:
             List of audio folder paths
         """
-        audio_folders = []
-
-        if not root_path.exists():
-            return audio_folders
+        if not os.path.isdir(root_path):
+            return []
 
         try:
-            for path in root_path.rglob(self.audio_folder_name):
-                if path.is_dir():
-                    audio_folders.append(path)
+            return list(self._iter_audio_folders(os.fspath(root_path)))
         except PermissionError as e:
             self.logger.error(f"Permission denied scanning {root_path}: {e}")
         except Exception as e:
             self.logger.error(f"Error scanning {root_path}: {e}")
 
-        return audio_folders
+        return []
+
+    def _iter_audio_folders(self, root: str):
+        """
+        Walk a directory tree with os.scandir, yielding audio files folders.
+
+        Hidden directories (.Trashes, .Spotlight-V100, ...) and symlinks
+        are skipped, and matched audio folders are not descended into.
+
+        Args:
+            root: Root path to search
+
+        Yields:
+            Paths of audio files folders
+        """
+        with os.scandir(root) as entries:
+            pending = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+
+        while pending:
+            entry = pending.pop()
+            if entry.name.startswith('.'):
+                continue
+            if entry.name == self.audio_folder_name:
+                yield entry.path
+                continue
+
+            try:
+                with os.scandir(entry.path) as entries:
+                    pending.extend(
+                        child for child in entries if child.is_dir(follow_symlinks=False)
+                    )
+            except OSError:
+                # Unreadable or vanished directory; skip it
+                continue
@@ -12,6 +12,9 @@
 # and distribution via Apple Music, iTunes Match, and iCloud Music Library.
 #
 # Usage: convert_mix.sh <input_file> <output_directory> [sample_rate]
+#
+# On success, the last line on stdout is "Output file: <path>" with the
+# path of the M4A that was written (it may carry an " (AAC n)" suffix).
 
 set -euo pipefail
 
@@ -145,6 +148,7 @@ if convert_with_afconvert_apple "$inpath" "$caf_file" "$outfile" "$final_sample_
   rm -f "$caf_file" 2>/dev/null || true
   notify "Bounce Watcher" "Converted: $(basename "$inpath") → $(basename "$outfile")"
   echo "✓ Successfully converted to: $outfile"
+  print -r -- "Output file: $outfile"
   exit 0
 fi
 
@@ -156,6 +160,7 @@ if command -v ffmpeg >/dev/null 2>&1; then
   if convert_with_ffmpeg "$inpath" "$outfile" 2> /tmp/bounce_watcher_conv_err.log; then
     notify "Bounce Watcher (ffmpeg)" "Converted: $(basename "$inpath") → $(basename "$outfile")"
     echo "✓ Successfully converted (ffmpeg) to: $outfile"
+    print -r -- "Output file: $outfile"
     exit 0
   fi
 fi